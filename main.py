@@ -1,5 +1,20 @@
+#!/usr/bin/env python
+import argparse
+
 from src.game import Game
+from src.settings import EXPORT_FRAME_TIMES, FRAME_TIMES_FILE
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--record", help="record input events and frame times to this file"
+    )
+    parser.add_argument(
+        "--export-frame-times",
+        action="store_true",
+        default=EXPORT_FRAME_TIMES,
+        help=f"append frame time stats to '{FRAME_TIMES_FILE.name}'",
+    )
+    args = parser.parse_args()
+    game = Game(export_frame_times=args.export_frame_times)
+    game.run(record=args.record)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+packs every animation folder of a character (eg. 'assets/images/player/{idle,run,jump}')
+into a single texture atlas:
+    - 'assets/images/atlases/<character>.png' contains all frames
+    - 'assets/images/atlases/<character>.json' maps each frame name to its rect in the atlas
+
+frame names are the image paths relative to the character directory without extension
+(eg. 'idle/idle-left-1')
+
+usage: ./scripts/build_atlas.py [--mirror] [character ...] (defaults to 'player')
+    --mirror: skip left facing frames, the game derives them from right facing ones
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame  # noqa: E402
+
+IMAGES_DIR = os.path.join("assets", "images")
+ATLASES_DIR = os.path.join(IMAGES_DIR, "atlases")
+
+
+def load_frames(character_dir: str, mirror: bool):
+    frames = {}
+    for fname in sorted(
+        glob.iglob(os.path.join(character_dir, "**", "*.png"), recursive=True)
+    ):
+        name = os.path.splitext(os.path.relpath(fname, character_dir))[0]
+        if mirror and "-left-" in os.path.basename(name):
+            continue
+        frames[name.replace(os.sep, "/")] = pygame.image.load(fname)
+    return frames
+
+
+def pack_frames(sizes):
+    """
+    shelf packing: frames are sorted by height and placed left to right in rows
+    returns atlas size and frame positions (in sizes order)
+    """
+    area = sum(w * h for w, h in sizes)
+    max_width = max(max(w for w, _ in sizes), math.ceil(math.sqrt(area)))
+    positions = [None] * len(sizes)
+    x, y, row_height, width = 0, 0, 0, 0
+    for i in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], i)):
+        w, h = sizes[i]
+        if x + w > max_width:
+            # start a new row
+            x, y, row_height = 0, y + row_height, 0
+        positions[i] = (x, y)
+        x += w
+        row_height = max(row_height, h)
+        width = max(width, x)
+    return (width, y + row_height), positions
+
+
+def build_atlas(character: str, mirror: bool) -> bool:
+    frames = load_frames(os.path.join(IMAGES_DIR, character), mirror)
+    if not frames:
+        print(f"no frame found for character '{character}'")
+        return False
+    names = list(frames.keys())
+    size, positions = pack_frames([frames[name].get_size() for name in names])
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    index = {"image": f"{character}.png", "frames": {}}
+    for name, pos in zip(names, positions):
+        atlas.blit(frames[name], pos)
+        index["frames"][name] = [*pos, *frames[name].get_size()]
+    os.makedirs(ATLASES_DIR, exist_ok=True)
+    pygame.image.save(atlas, os.path.join(ATLASES_DIR, index["image"]))
+    with open(os.path.join(ATLASES_DIR, f"{character}.json"), "w") as f:
+        json.dump(index, f, indent=4)
+    print(f"packed {len(names)} frames of '{character}' into a {size[0]}x{size[1]} atlas")
+    return True
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--mirror", action="store_true")
+parser.add_argument("characters", nargs="*", default=["player"])
+args = parser.parse_args()
+
+if all([build_atlas(character, args.mirror) for character in args.characters]):
+    print("success")
+    sys.exit(0)
+
+print("failure")
+sys.exit(1)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+packs assets read by the game in a single asset bundle (see src/bundle.py):
+'assets/{fonts,i18n,images,levels,sounds}/**' => 'assets.bundle'
+
+loaders read assets from the bundle when it exists, except loose files edited since
+it was built (a warning is logged), delete it to always read loose files
+
+usage: ./scripts/build_bundle.py [--output FILE]
+"""
+import argparse
+import os
+import pathlib
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from src.bundle import dump_bundle  # noqa: E402
+from src.settings import (  # noqa: E402
+    ASSETS_BUNDLE,
+    ASSETS_DIR,
+    FONTS_DIR,
+    I18N_DIR,
+    IMAGES_DIR,
+    LEVELS_DIR,
+    SOUNDS_DIR,
+)
+
+# level sources are only read by scripts/build_level.py
+EXCLUDED_SUFFIXES = {".txt"}
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--output", default=ASSETS_BUNDLE, help="bundle file")
+args = parser.parse_args()
+
+fnames = sorted(
+    fname
+    for directory in (FONTS_DIR, I18N_DIR, IMAGES_DIR, LEVELS_DIR, SOUNDS_DIR)
+    for fname in directory.rglob("*")
+    if fname.is_file() and fname.suffix not in EXCLUDED_SUFFIXES
+)
+assets = (
+    (fname.relative_to(ASSETS_DIR).as_posix(), fname.read_bytes()) for fname in fnames
+)
+with open(args.output, "wb") as f:
+    dump_bundle(assets, f)
+print(f"packed {len(fnames)} assets in '{args.output}'")
+print("success")
+sys.exit(0)
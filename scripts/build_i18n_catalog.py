@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+compiles locale JSON files to the i18n catalog read by the game (see
+src/translations.py): 'assets/i18n/*.json' => 'i18n.catalog.json'
+
+fails when locales do not define the same keys or when keys differ from the ones
+used in source files (see check_i18n_keys.py)
+the catalog is compiled from locale JSON files at startup when it does not exist or
+is older than them (without checking used keys, CI runs this script to do so)
+
+usage: ./scripts/build_i18n_catalog.py [--output FILE]
+"""
+import argparse
+import json
+import os
+import pathlib
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from check_i18n_keys import parse_source_files  # noqa: E402
+from src.settings import I18N_CATALOG, ROOT_DIR  # noqa: E402
+from src.translations import compile_catalog, load_translations  # noqa: E402
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--output", default=I18N_CATALOG, help="catalog file")
+args = parser.parse_args()
+
+try:
+    catalog = compile_catalog(
+        load_translations(), parse_source_files(str(ROOT_DIR / "src"))
+    )
+except ValueError as e:
+    print(e)
+    print("failure")
+    sys.exit(1)
+with open(args.output, "w") as f:
+    json.dump(catalog, f, ensure_ascii=False, separators=(",", ":"))
+print(f"compiled {len(catalog['keys'])} keys of {len(catalog['locales'])} locales")
+print("success")
+sys.exit(0)
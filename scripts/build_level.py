@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+builds binary tile maps loaded by the game from text level sources:
+'assets/levels/<level>.txt' => 'assets/levels/<level>.map'
+
+level source format (lines starting with ';' are comments):
+    tileset <tileset image path relative to 'assets/images'>
+    tile_size <tile size in pixels>
+    layer <name> [solid]
+    <one line per tile row, one character per tile (see LEGEND)>
+    layer <name> [solid]
+    ...
+
+usage: ./scripts/build_level.py [level ...] (defaults to all levels)
+"""
+import array
+import glob
+import os
+import pathlib
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from src.tilemap import TileLayer, TileMap, dump_tile_map  # noqa: E402
+
+LEVELS_DIR = os.path.join("assets", "levels")
+# tile character => tile id
+LEGEND = {".": 0, "#": 1, "%": 2, "=": 3, "+": 4}
+
+
+def parse_level(fname: str) -> TileMap:
+    tileset, tile_size, layers, rows = None, None, [], {}
+    with open(fname, "r") as f:
+        for line in f.read().splitlines():
+            if not line or line.startswith(";"):
+                continue
+            keyword, _, value = line.partition(" ")
+            if keyword == "tileset":
+                tileset = value
+            elif keyword == "tile_size":
+                tile_size = int(value)
+            elif keyword == "layer":
+                name, _, flags = value.partition(" ")
+                flags = TileLayer.SOLID if flags == "solid" else 0
+                layers.append(TileLayer(name, array.array("H"), flags))
+                rows[name] = []
+            else:
+                rows[layers[-1].name].append([LEGEND[c] for c in line])
+    width = len(rows[layers[0].name][0])
+    height = len(rows[layers[0].name])
+    for layer in layers:
+        if len(rows[layer.name]) != height or any(
+            len(row) != width for row in rows[layer.name]
+        ):
+            raise ValueError(f"layer '{layer.name}' is not {width}x{height} tiles")
+        for row in rows[layer.name]:
+            layer.tiles.extend(row)
+    return TileMap(width, height, tile_size, tileset, layers)
+
+
+def build_level(fname: str) -> bool:
+    try:
+        tile_map = parse_level(fname)
+    except (KeyError, ValueError, IndexError) as e:
+        print(f"invalid level '{fname}': {e!r}")
+        return False
+    with open(os.path.splitext(fname)[0] + ".map", "wb") as f:
+        f.write(dump_tile_map(tile_map))
+    print(f"built '{fname}' ({tile_map.width}x{tile_map.height} tiles)")
+    return True
+
+
+levels = [os.path.join(LEVELS_DIR, f"{level}.txt") for level in sys.argv[1:]]
+levels = levels or sorted(glob.glob(os.path.join(LEVELS_DIR, "*.txt")))
+if all([build_level(fname) for fname in levels]):
+    print("success")
+    sys.exit(0)
+
+print("failure")
+sys.exit(1)
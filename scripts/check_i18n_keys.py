@@ -30,8 +30,8 @@ def parse_json_files(i18n_dir: str):
 
 def parse_source_files(src_dir: str):
     # look for i18n keys in python source files
-    # eg. tmp.py contains "i18n.t('game_over')" => retrieves 'game_over'
-    regex = re.compile("i18n\.t\(['\"]([^'\"]+)")
+    # eg. tmp.py contains "t('game_over')" => retrieves 'game_over'
+    regex = re.compile("\\bt\\(['\"]([^'\"]+)")
     keys_from_python = set()  # all i18n keys from python source files
     for fname in glob.iglob(os.path.join(src_dir, "**", "*.py"), recursive=True):
         with open(fname, "r") as f:
@@ -62,17 +62,18 @@ def compare_keys_from_json_and_sources(keys_from_json, keys_from_python) -> bool
     return success
 
 
-i18n_fname_json, keys_from_json = parse_json_files(I18N_DIR)
-keys_from_python = parse_source_files(SRC_DIR)
+if __name__ == "__main__":
+    i18n_fname_json, keys_from_json = parse_json_files(I18N_DIR)
+    keys_from_python = parse_source_files(SRC_DIR)
 
-json_compare = compare_json_files(i18n_fname_json, keys_from_json)
-json_source_compare = compare_keys_from_json_and_sources(
-    keys_from_json, keys_from_python
-)
+    json_compare = compare_json_files(i18n_fname_json, keys_from_json)
+    json_source_compare = compare_keys_from_json_and_sources(
+        keys_from_json, keys_from_python
+    )
 
-if json_compare and json_source_compare:
-    print("success")
-    sys.exit(0)
+    if json_compare and json_source_compare:
+        print("success")
+        sys.exit(0)
 
-print("failure")
-sys.exit(1)
+    print("failure")
+    sys.exit(1)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+replays a recording made with './main.py --record FILE' without display (SDL dummy
+video and audio drivers) and as fast as possible, then prints frame time stats
+
+usage: ./scripts/replay.py [--repeat N] FILE
+"""
+import argparse
+import json
+import os
+import pathlib
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from src.game import Game  # noqa: E402
+from src.replay import load_recording  # noqa: E402
+
+parser = argparse.ArgumentParser()
+parser.add_argument("recording")
+parser.add_argument("--repeat", type=int, default=1, help="replays count")
+args = parser.parse_args()
+
+settings, frames = load_recording(args.recording)
+recorded_time = sum(frame.dt for frame in frames)
+for _ in range(args.repeat):
+    game = Game(**settings)
+    start = time.perf_counter()
+    try:
+        count = game.replay(args.recording)
+    except Exception as e:
+        print(f"replay of '{args.recording}' failed: {e!r}")
+        print("failure")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"replayed {count} frames ({recorded_time / 1000:.1f}s) in "
+        f"{elapsed / 1000:.1f}s ({recorded_time / elapsed:.1f}x real time)"
+    )
+    print(json.dumps(game._frame_times.get_stats(), indent=4))
+
+print("success")
+sys.exit(0)
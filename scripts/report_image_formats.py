@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+reports the pixel format every image of 'assets/images' is converted to by
+load_image (see ImageFormat) and its size in memory
+
+usage: ./scripts/report_image_formats.py [--json]
+"""
+import argparse
+import collections
+import json
+import os
+import pathlib
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pygame  # noqa: E402
+
+from src.graphics import _sizeof_surface, image_formats, load_image  # noqa: E402
+from src.settings import IMAGES_DIR, WINDOW_SIZE  # noqa: E402
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--json", action="store_true", help="print report as JSON")
+args = parser.parse_args()
+
+pygame.display.init()
+pygame.display.set_mode(WINDOW_SIZE)
+report = {}
+for fullpath in sorted(IMAGES_DIR.rglob("*.png")):
+    image = load_image(fullpath.relative_to(IMAGES_DIR))
+    report[fullpath.relative_to(IMAGES_DIR).as_posix()] = {
+        "format": image_formats[fullpath].name,
+        "bytes": _sizeof_surface(image),
+    }
+pygame.quit()
+
+if args.json:
+    print(json.dumps(report, indent=4))
+else:
+    for name, r in report.items():
+        print(f"{r['format']:<8s} {r['bytes']:>9d} {name}")
+    counts = collections.Counter(r["format"] for r in report.values())
+    print(", ".join(f"{count} {fmt}" for fmt, count in sorted(counts.items())))
+print("success")
+sys.exit(0)
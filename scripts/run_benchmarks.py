@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+"""
+runs headless benchmarks (SDL dummy video and audio drivers) of:
+    - game frames per second for each scene
+    - PlayerAnimationHandler construction time
+    - cold (not cached) and warm (cached) image, font and sound loading time
+    - PlayerSprite updates throughput
+    - EntityStore (batched physics) updates throughput
+    - memory per entity, animation handler and view model instance (in bytes)
+
+results are printed as JSON, they can be saved as a baseline and compared to one:
+a benchmark fails when it is more than TOLERANCE slower than the baseline
+timings depend on the machine, only compare to a baseline measured on the same one
+(eg. run of the previous revision, see .github/workflows/run-benchmarks.yml)
+
+usage: ./scripts/run_benchmarks.py [--save FILE] [--baseline FILE] [--tolerance RATIO]
+"""
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pygame  # noqa: E402
+
+from src.core import SelectionViewModel  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.graphics import (  # noqa: E402
+    PlayerAnimationHandler,
+    PlayerBody,
+    PlayerSprite,
+    asset_cache,
+    load_font,
+    load_image,
+    load_sound,
+)
+from src.physics import EntityStore  # noqa: E402
+from src.scenes.level_scene import LevelScene  # noqa: E402
+from src.scenes.locale_selection_scene import LocaleSelectionScene  # noqa: E402
+from src.scenes.menu_scene import MenuScene  # noqa: E402
+from src.settings import BLANKA_FONT, CLICK_SOUND, FPS, LOCALES  # noqa: E402
+from src.translations import set_locale  # noqa: E402
+
+FRAMES = 200  # per repeat
+REPEATS = 50
+ENTITIES = 1000
+ENTITY_STEPS = 60
+STORE_ENTITIES = 10000
+
+
+def measure(func, repeats=REPEATS, number=1, setup=None) -> float:
+    """median duration of func in milliseconds (called number times per repeat)"""
+    durations = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        durations.append((time.perf_counter() - start) * 1000 / number)
+    return statistics.median(durations)
+
+
+def measure_memory(factory, number=ENTITIES) -> float:
+    """memory allocated per object created by factory in bytes"""
+    factory()  # shared data (eg. animation frames) is not accounted
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(number)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / number
+
+
+def clear_caches():
+    asset_cache.clear()
+
+
+def result(value: float, unit: str, higher_is_better=False) -> dict:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def bench_scenes(game: Game) -> dict:
+    set_locale(LOCALES[0])
+    scenes = {
+        "locale_selection_scene": lambda: LocaleSelectionScene(
+            LOCALES, game._scene_queue
+        ),
+        "menu_scene": lambda: MenuScene(game._scene_queue),
+        "level_scene": LevelScene,
+    }
+    results = {}
+    for name, scene_factory in scenes.items():
+        game._scene = scene_factory()
+        frame_duration = measure(
+            lambda: game._run_frame(1000 // FPS), repeats=20, number=FRAMES
+        )
+        results[f"{name}_fps"] = result(
+            1000 / frame_duration, "frames/s", higher_is_better=True
+        )
+    return results
+
+
+def bench_player_animation_handler() -> dict:
+    return {
+        "player_animation_handler_cold": result(
+            measure(PlayerAnimationHandler, setup=clear_caches), "ms"
+        ),
+        "player_animation_handler_warm": result(
+            measure(PlayerAnimationHandler, number=1000), "ms"
+        ),
+    }
+
+
+def bench_loaders() -> dict:
+    loaders = {
+        "load_image": lambda: load_image("flag_en.png"),
+        "load_font": lambda: load_font(BLANKA_FONT, 50),
+        "load_sound": lambda: load_sound(CLICK_SOUND),
+    }
+    results = {}
+    for name, load in loaders.items():
+        results[f"{name}_cold"] = result(measure(load, setup=clear_caches), "ms")
+        results[f"{name}_warm"] = result(measure(load, number=1000), "ms")
+    return results
+
+
+def bench_player_sprites() -> dict:
+    players = [PlayerSprite(vx=PlayerSprite.max_vx_speed) for _ in range(ENTITIES)]
+    dt = 1000 // FPS
+
+    def update():
+        for _ in range(ENTITY_STEPS):
+            for player in players:
+                player.apply_gravity(dt)
+                player.update_horizontal_pos(dt)
+                player.update_vertical_pos(dt)
+                player.update_image(dt)
+
+    duration = measure(update, repeats=5) / 1000
+    return {
+        "player_sprite_updates": result(
+            ENTITIES * ENTITY_STEPS / duration, "updates/s", higher_is_better=True
+        )
+    }
+
+
+def bench_entity_store() -> dict:
+    store = EntityStore(capacity=STORE_ENTITIES)
+    for i in range(STORE_ENTITIES):
+        store.add(i, 0, vx=PlayerSprite.max_vx_speed)
+    dt = 1000 // FPS
+
+    def update():
+        for _ in range(ENTITY_STEPS):
+            store.step(dt)
+            store.hit_ground(store.positions[:, 1] > 1000)
+
+    duration = measure(update, repeats=5) / 1000
+    return {
+        "entity_store_updates": result(
+            STORE_ENTITIES * ENTITY_STEPS / duration, "updates/s", higher_is_better=True
+        )
+    }
+
+
+def bench_memory() -> dict:
+    factories = {
+        "player_sprite": PlayerSprite,
+        "player_body": PlayerBody,
+        "player_animation_handler": PlayerAnimationHandler,
+        "selection_view_model": lambda: SelectionViewModel(LOCALES),
+    }
+    return {
+        f"{name}_bytes": result(measure_memory(factory), "bytes")
+        for name, factory in factories.items()
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    success = True
+    for name, r in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["value"], r["value"]
+        ratio = before / after if r["higher_is_better"] else after / before
+        if ratio > 1 + tolerance:
+            print(f"regression of '{name}': {before:.4g} -> {after:.4g} {r['unit']}")
+            success = False
+    return success
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--save", help="save results to this file")
+parser.add_argument("--baseline", help="compare results to this file")
+parser.add_argument("--tolerance", type=float, default=1.0)
+args = parser.parse_args()
+
+game = Game()
+results = {}
+results.update(bench_scenes(game))
+results.update(bench_player_animation_handler())
+results.update(bench_loaders())
+results.update(bench_player_sprites())
+results.update(bench_entity_store())
+results.update(bench_memory())
+pygame.quit()
+
+print(json.dumps(results, indent=4))
+if args.save:
+    with open(args.save, "w") as f:
+        json.dump(results, f, indent=4)
+
+if args.baseline:
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    if not compare(results, baseline, args.tolerance):
+        print("failure")
+        sys.exit(1)
+
+print("success")
+sys.exit(0)
@@ -0,0 +1,169 @@
+import functools
+import io
+import logging
+import mmap
+import os
+import pathlib
+import struct
+from typing import BinaryIO, Dict, FrozenSet, Iterable, Iterator, Tuple
+
+from src.settings import ASSETS_BUNDLE, ASSETS_DIR, USE_ASSETS_BUNDLE
+
+logger = logging.getLogger(__name__)
+
+# asset bundle file format (little endian):
+#   header: magic b"ABDL", version (u8), entry count (u32)
+#   index: for each entry
+#       path length (u16), asset path relative to assets directory (utf-8, posix)
+#       offset from file start (u64), size (u64)
+#   data: assets content, in index order
+BUNDLE_MAGIC = b"ABDL"
+BUNDLE_VERSION = 1
+_HEADER = struct.Struct("<4sBI")
+_ENTRY = struct.Struct("<QQ")
+
+
+def dump_bundle(assets: Iterable[Tuple[str, bytes]], f: BinaryIO):
+    """write (path, content) assets to f in asset bundle file format"""
+    assets = list(assets)
+    paths = [path.encode("utf-8") for path, _ in assets]
+    offset = _HEADER.size + sum(2 + len(p) + _ENTRY.size for p in paths)
+    f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(assets)))
+    for path, (_, content) in zip(paths, assets):
+        f.write(struct.pack("<H", len(path)) + path)
+        f.write(_ENTRY.pack(offset, len(content)))
+        offset += len(content)
+    for _, content in assets:
+        f.write(content)
+
+
+class BufferReader(io.RawIOBase):
+    """read-only file-like object over a buffer (reads copy from it directly)"""
+
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._buffer[self._pos : self._pos + len(b)]
+        b[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence=io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetBundle:
+    """memory mapped asset bundle, assets are read without copying the file"""
+
+    def __init__(self, filename: str | pathlib.Path):
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.mtime = os.fstat(f.fileno()).st_mtime
+        self._data = memoryview(self._mmap)
+        magic, version, count = _HEADER.unpack_from(self._data)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"unsupported bundle (magic {magic}, version {version})")
+        self._index: Dict[str, Tuple[int, int]] = {}
+        offset = _HEADER.size
+        for _ in range(count):
+            (length,) = struct.unpack_from("<H", self._data, offset)
+            path = bytes(self._data[offset + 2 : offset + 2 + length]).decode("utf-8")
+            offset += 2 + length
+            self._index[path] = _ENTRY.unpack_from(self._data, offset)
+            offset += _ENTRY.size
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def read(self, path: str) -> memoryview:
+        """asset content (a view of the mapped file, not a copy)"""
+        offset, size = self._index[path]
+        return self._data[offset : offset + size]
+
+    def open(self, path: str) -> BufferReader:
+        return BufferReader(self.read(path))
+
+    def size(self, path: str) -> int:
+        return self._index[path][1]
+
+
+@functools.cache
+def get_bundle() -> AssetBundle | None:
+    """Open ASSETS_BUNDLE once (None when disabled or not built)"""
+    if not USE_ASSETS_BUNDLE or not ASSETS_BUNDLE.exists():
+        return None
+    logger.info("Open asset bundle '%s'", ASSETS_BUNDLE)
+    return AssetBundle(ASSETS_BUNDLE)
+
+
+@functools.cache
+def _get_edited_assets() -> FrozenSet[str]:
+    """
+    bundled assets whose loose file was edited after the bundle was built, checked
+    once and only in a development tree (a shipped game has no loose assets)
+    """
+    bundle = get_bundle()
+    if bundle is None or not ASSETS_DIR.is_dir():
+        return frozenset()
+    edited = set()
+    for path in bundle:
+        try:
+            if (ASSETS_DIR / path).stat().st_mtime > bundle.mtime:
+                edited.add(path)
+        except FileNotFoundError:
+            pass
+    for path in sorted(edited):
+        logger.warning("'%s' is newer than the asset bundle, rebuild it", path)
+    return frozenset(edited)
+
+
+def _get_bundle_path(fullpath: pathlib.Path) -> str | None:
+    """fullpath key in asset bundle (None if it is not bundled or edited since)"""
+    bundle = get_bundle()
+    if bundle is None or not fullpath.is_relative_to(ASSETS_DIR):
+        return None
+    path = fullpath.relative_to(ASSETS_DIR).as_posix()
+    if path not in bundle or path in _get_edited_assets():
+        return None
+    return path
+
+
+def get_asset_source(fullpath: pathlib.Path) -> pathlib.Path | BinaryIO:
+    """
+    what pygame loaders should read fullpath from: a file-like object reading the
+    asset bundle or fullpath itself (loose file, eg. during development)
+    """
+    path = _get_bundle_path(fullpath)
+    return fullpath if path is None else get_bundle().open(path)
+
+
+def read_asset(fullpath: pathlib.Path) -> bytes | memoryview:
+    path = _get_bundle_path(fullpath)
+    return fullpath.read_bytes() if path is None else get_bundle().read(path)
+
+
+def get_asset_size(fullpath: pathlib.Path) -> int:
+    path = _get_bundle_path(fullpath)
+    return fullpath.stat().st_size if path is None else get_bundle().size(path)
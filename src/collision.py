@@ -0,0 +1,178 @@
+import collections
+import math
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+import pygame
+
+from src.settings import COLLISION_CELL_SIZE
+from src.tilemap import TileMap
+
+CellsRange = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """index rects in a uniform grid of cell_size pixels cells"""
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = collections.defaultdict(
+            set
+        )
+        # key -> (rect, covered cells range as (min_cx, min_cy, max_cx, max_cy))
+        self._entries: Dict[Hashable, Tuple[pygame.Rect, CellsRange]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_rect(self, key: Hashable) -> pygame.Rect:
+        return self._entries[key][0]
+
+    def insert(self, key: Hashable, rect: pygame.Rect):
+        cells = self._get_cells_range(rect)
+        self._entries[key] = (pygame.Rect(rect), cells)
+        for cell in self._iter_cells(cells):
+            self._cells[cell].add(key)
+
+    def remove(self, key: Hashable):
+        _, cells = self._entries.pop(key)
+        for cell in self._iter_cells(cells):
+            self._cells[cell].discard(key)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def move(self, key: Hashable, rect: pygame.Rect):
+        """update key rect, cells are only updated when rect crosses a cell border"""
+        _, cells = self._entries[key]
+        if self._get_cells_range(rect) == cells:
+            self._entries[key] = (pygame.Rect(rect), cells)
+            return
+        self.remove(key)
+        self.insert(key, rect)
+
+    def query(self, rect: pygame.Rect) -> List[Hashable]:
+        """keys whose rect collides with rect"""
+        keys = set()
+        for cell in self._iter_cells(self._get_cells_range(rect)):
+            keys.update(self._cells.get(cell, ()))
+        return [key for key in keys if self._entries[key][0].colliderect(rect)]
+
+    def _get_cells_range(self, rect: pygame.Rect) -> CellsRange:
+        cs = self._cell_size
+        return (
+            rect.left // cs,
+            rect.top // cs,
+            (rect.right - 1) // cs,
+            (rect.bottom - 1) // cs,
+        )
+
+    @staticmethod
+    def _iter_cells(cells: CellsRange) -> Iterable[Tuple[int, int]]:
+        min_cx, min_cy, max_cx, max_cy = cells
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                yield cx, cy
+
+
+def get_solid_rects(tile_map: TileMap) -> List[pygame.Rect]:
+    """rects of solid tiles (contiguous tiles of a row are merged in a single rect)"""
+    ts = tile_map.tile_size
+    rects = []
+    for layer in tile_map.layers:
+        if not layer.solid:
+            continue
+        for y in range(tile_map.height):
+            x = 0
+            while x < tile_map.width:
+                if not tile_map.get_tile(layer, x, y):
+                    x += 1
+                    continue
+                start = x
+                while x < tile_map.width and tile_map.get_tile(layer, x, y):
+                    x += 1
+                rects.append(pygame.Rect(start * ts, y * ts, (x - start) * ts, ts))
+    return rects
+
+
+class CollisionWorld:
+    """
+    resolve sprites movements against static level geometry
+    sprites are moved one axis at a time and stopped at the first obstacle on their
+    path (swept AABB), so fast sprites cannot go through thin obstacles
+    """
+
+    def __init__(
+        self, static_rects: Iterable[pygame.Rect], cell_size=COLLISION_CELL_SIZE
+    ):
+        self._static = SpatialHash(cell_size)
+        for i, rect in enumerate(static_rects):
+            self._static.insert(i, rect)
+        self._sprites = SpatialHash(cell_size)
+
+    def add_sprite(self, sprite: pygame.sprite.Sprite):
+        self._sprites.insert(sprite, sprite.rect)
+
+    def remove_sprite(self, sprite: pygame.sprite.Sprite):
+        self._sprites.remove(sprite)
+
+    def query_sprites(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """sprites colliding with rect"""
+        return self._sprites.query(rect)
+
+    def move_sprite(
+        self,
+        sprite: pygame.sprite.Sprite,
+        dx: float,
+        dy: float,
+        remainder: Tuple[float, float] = (0.0, 0.0),
+    ) -> Tuple[float, float]:
+        """
+        move sprite by (dx, dy) pixels, stopping at obstacles
+        calls sprite.hit_ground or sprite.hit_roof on vertical collisions
+        remainder is the sub-pixel position of sprite (in [0, 1) on each axis, rect
+        coordinates are integers), return its new sub-pixel position: carry it to the
+        next move so that small moves add up whatever the tick rate
+        """
+        rect = sprite.rect
+        x, _ = self._sweep(rect, rect.x + remainder[0], dx, horizontal=True)
+        rect.x = math.floor(x)
+        y, blocked = self._sweep(rect, rect.y + remainder[1], dy, horizontal=False)
+        rect.y = math.floor(y)
+        if blocked and dy > 0:
+            sprite.hit_ground()
+        elif blocked and dy < 0:
+            sprite.hit_roof()
+        if sprite in self._sprites:
+            self._sprites.move(sprite, rect)
+        return x - rect.x, y - rect.y
+
+    def _sweep(
+        self, rect: pygame.Rect, pos: float, d: float, horizontal: bool
+    ) -> Tuple[float, bool]:
+        """
+        position (rect left or top, with its sub-pixel part) reached by moving rect
+        along an axis and whether an obstacle stops it
+        """
+        if d == 0:
+            return pos, False
+        start = rect.x if horizontal else rect.y
+        # pixels entered by rect, contact with an obstacle (distance 0) is a collision
+        length = max(1, abs(math.floor(pos + d) - start))
+        if horizontal:
+            x = rect.right if d > 0 else rect.left - length
+            swept = pygame.Rect(x, rect.top, length, rect.height)
+        else:
+            y = rect.bottom if d > 0 else rect.top - length
+            swept = pygame.Rect(rect.left, y, rect.width, length)
+        obstacles = [self._static.get_rect(k) for k in self._static.query(swept)]
+        if not obstacles:
+            return pos + d, False
+        if horizontal and d > 0:
+            return min(o.left for o in obstacles) - rect.width, True
+        if horizontal:
+            return max(o.right for o in obstacles), True
+        if d > 0:
+            return min(o.top for o in obstacles) - rect.height, True
+        return max(o.bottom for o in obstacles), True
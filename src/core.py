@@ -1,14 +1,67 @@
 import abc
-from typing import Any, List, Tuple
+import collections
+from typing import Any, Callable, Dict, Generic, List, Set, Tuple, TypeVar
 
 import pygame
 
+# input event types, SDL only queues the ones the active input handler listens to
+# (window and display events, eg. expose or focus, are always queued)
+INPUT_EVENTS = (
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTEDITING,
+    pygame.TEXTINPUT,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.CONTROLLERAXISMOTION,
+    pygame.CONTROLLERBUTTONDOWN,
+    pygame.CONTROLLERBUTTONUP,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.MULTIGESTURE,
+)
+
 
 class InputHandler:
-    """handle user inputs"""
+    """
+    handle user inputs
+    every pending event is dispatched each frame (up to max_events_per_frame, remaining
+    events are dispatched next frames), dispatch stops when a callback returns True
+    (eg. when it switches scene)
+    """
+
+    # input handler which configured event types allowed in SDL event queue
+    _allowed_events_owner: "InputHandler | None" = None
+    # key down callbacks active in every scene (eg. debug keys)
+    global_key_down_callbacks: Dict[int, Callable] = {}
+    # callbacks of other event types active in every scene (eg. redraw after expose)
+    global_event_callbacks: Dict[int, Callable] = {}
+    # replaces pygame.event.get when set (eg. to record or replay events)
+    event_source: Callable[[], List[pygame.event.Event]] | None = None
+
+    def __init__(self, max_events_per_frame: int | None = None):
+        self._max_events_per_frame = max_events_per_frame
+        self._pending_events = collections.deque()
 
     def handle_inputs(self):
-        for event in pygame.event.get():
+        self._allow_events()
+        if InputHandler.event_source is None:
+            self._pending_events.extend(pygame.event.get())
+        else:
+            self._pending_events.extend(InputHandler.event_source())
+        budget = self._max_events_per_frame
+        while self._pending_events and (budget is None or budget > 0):
+            event = self._pending_events.popleft()
+            if budget is not None:
+                budget -= 1
             if event.type == pygame.QUIT:
                 return self._on_quit(event)
             callbacks = None
@@ -16,9 +69,26 @@ class InputHandler:
                 callbacks = self.get_key_up_callbacks()
             elif event.type == pygame.KEYDOWN:
                 callbacks = self.get_key_down_callbacks()
-            callback = callbacks.get(event.key, None) if callbacks is not None else None
-            if callback is not None:
-                return callback(event)
+                if event.key in self.global_key_down_callbacks:
+                    callbacks = self.global_key_down_callbacks
+            if callbacks is not None:
+                callback = callbacks.get(event.key, None)
+            else:
+                callback = self.global_event_callbacks.get(event.type, None)
+            if callback is not None and callback(event):
+                # remaining events are not meant for this input handler
+                self._pending_events.clear()
+                return
+
+    def get_allowed_events(self) -> List[int]:
+        """event types queued by SDL while this input handler is active"""
+        allowed_events = [pygame.QUIT]
+        if self.get_key_down_callbacks() or self.global_key_down_callbacks:
+            allowed_events.append(pygame.KEYDOWN)
+        if self.get_key_up_callbacks():
+            allowed_events.append(pygame.KEYUP)
+        allowed_events.extend(self.global_event_callbacks)
+        return allowed_events
 
     def get_key_down_callbacks(self) -> dict | None:
         return None
@@ -30,12 +100,70 @@ class InputHandler:
         pygame.quit()
         quit()
 
+    def _allow_events(self):
+        if InputHandler._allowed_events_owner is self or not pygame.display.get_init():
+            return
+        # SDL does not queue input events no callback listens to
+        allowed_events = self.get_allowed_events()
+        pygame.event.set_allowed(None)
+        pygame.event.set_blocked([t for t in INPUT_EVENTS if t not in allowed_events])
+        InputHandler._allowed_events_owner = self
+
 
 class Renderer(abc.ABC):
     """handle rendering"""
 
     @abc.abstractmethod
-    def render(self, screen: pygame.surface.Surface):
+    def render(self, screen: pygame.surface.Surface, alpha: float = 1.0):
+        pass
+
+
+class DirtyRectRenderer(Renderer):
+    """handle rendering by only redrawing and updating screen regions marked as dirty"""
+
+    def __init__(self, dirty_rects=True, background_color=(0, 0, 0)):
+        # when dirty_rects is False, the whole screen is redrawn every frame
+        self._dirty_rects_enabled = dirty_rects
+        self._background_color = background_color
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    def mark_dirty(self, rect: pygame.Rect):
+        """redraw rect on next render"""
+        self._dirty_rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """redraw the whole screen on next render"""
+        self._full_redraw = True
+
+    def render(self, screen: pygame.surface.Surface, alpha: float = 1.0):
+        self.check_dirty()
+        screen_rect = screen.get_rect()
+        if self._full_redraw or not self._dirty_rects_enabled:
+            rects = [screen_rect]
+        else:
+            rects = [r.clip(screen_rect) for r in self._dirty_rects]
+            rects = [r for r in rects if r.width and r.height]
+        self._dirty_rects = []
+        self._full_redraw = False
+        if not rects:
+            # nothing changed since last render
+            return
+        clip = screen.get_clip()
+        for rect in rects:
+            # drawing is clipped so only the dirty region is touched
+            screen.set_clip(rect)
+            screen.fill(self._background_color, rect)
+            self.draw(screen)
+        screen.set_clip(clip)
+        pygame.display.update(rects)
+
+    def check_dirty(self):
+        """called before each render, mark changed screen regions as dirty here"""
+        pass
+
+    @abc.abstractmethod
+    def draw(self, screen: pygame.surface.Surface):
         pass
 
 
@@ -53,16 +181,153 @@ class Scene:
     def handle_inputs(self):
         pass
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        """alpha is the interpolation factor in [0, 1[ between the last two simulation steps"""
         pass
 
     def update(self, dt: int):
         pass
 
+    def invalidate(self):
+        """redraw the whole screen on next render (eg. after an overlay was hidden)"""
+        pass
+
+    def wait(self):
+        """block until the scene this scene switches to is queued (replays)"""
+        pass
+
+
+class FixedTimestep:
+    """split variable frame time into fixed simulation steps"""
+
+    def __init__(self, tick_rate: int, max_steps: int):
+        self._step = 1000 / tick_rate  # in milliseconds
+        self._max_steps = max_steps
+        self._accumulator = 0.0  # in milliseconds
+
+    @property
+    def step(self) -> float:
+        return self._step
+
+    @property
+    def alpha(self) -> float:
+        return self._accumulator / self._step
+
+    def advance(self, dt: int) -> int:
+        """add frame time and return the number of simulation steps to run"""
+        self._accumulator += dt
+        steps = int(self._accumulator // self._step)
+        self._accumulator -= steps * self._step
+        # spiral of death guard: drop simulation time which cannot be caught up
+        return min(steps, self._max_steps)
+
+
+T = TypeVar("T")
+
+
+class ObjectPool(Generic[T]):
+    """
+    reuse released objects instead of allocating new ones in the frame loop
+    reset(obj, *args, **kwargs) reinitializes acquired objects (new or reused)
+    at most max_size released objects are kept (None for no limit)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        reset: Callable[..., None] | None = None,
+        max_size: int | None = None,
+    ):
+        self._factory = factory
+        self._reset = reset
+        self._max_size = max_size
+        self._free: List[T] = []
+        self._free_ids: Set[int] = set()  # to detect objects released twice
+        self._in_use = 0
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def __len__(self) -> int:
+        """number of released objects waiting for reuse"""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs) -> T:
+        if self._free:
+            obj = self._free.pop()
+            self._free_ids.discard(id(obj))
+            self._reused += 1
+        else:
+            obj = self._factory()
+            self._created += 1
+        if self._reset is not None:
+            self._reset(obj, *args, **kwargs)
+        self._in_use += 1
+        return obj
+
+    def release(self, obj: T):
+        """
+        obj must not be used after being released
+        raise ValueError if obj was already released (and is waiting for reuse)
+        """
+        if id(obj) in self._free_ids:
+            raise ValueError(f"{obj!r} is released twice")
+        self._in_use -= 1
+        if self._max_size is not None and len(self._free) >= self._max_size:
+            self._discarded += 1
+            return
+        self._free.append(obj)
+        self._free_ids.add(id(obj))
+
+    def prefill(self, count: int):
+        """allocate objects up front (eg. while loading a scene)"""
+        for _ in range(count):
+            obj = self._factory()
+            self._free.append(obj)
+            self._free_ids.add(id(obj))
+            self._created += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self._created,
+            "reused": self._reused,
+            "discarded": self._discarded,
+            "in_use": self._in_use,
+            "free": len(self._free),
+        }
+
+
+class SpritePool(ObjectPool[pygame.sprite.Sprite]):
+    """
+    pool of sprites, acquired sprites are added to groups and released sprites are
+    removed from every group they belong to
+    """
+
+    def acquire(
+        self, *args, groups: Tuple[pygame.sprite.AbstractGroup] = (), **kwargs
+    ) -> pygame.sprite.Sprite:
+        sprite = super().acquire(*args, **kwargs)
+        sprite.add(*groups)
+        return sprite
+
+    def release(self, sprite: pygame.sprite.Sprite):
+        super().release(sprite)
+        sprite.kill()
+
+
+class RectPool(ObjectPool[pygame.Rect]):
+    """pool of rects, acquire takes pygame.Rect arguments"""
+
+    def __init__(self, max_size: int | None = None):
+        super().__init__(lambda: pygame.Rect(0, 0, 0, 0), pygame.Rect.update, max_size)
+
 
 class SelectionViewModel:
     """view model for selection with cursor screen"""
 
+    __slots__ = ("_collection", "_cursor_pos")
+
     def __init__(self, collection: List[Any] | Tuple[Any], cursor_pos=0):
         self._collection = (
             collection if isinstance(collection, tuple.__class__) else tuple(collection)
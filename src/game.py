@@ -1,37 +1,169 @@
 import logging
+import pathlib
 import queue
+import time
 
 import pygame
+from pygame._sdl2.video import Window
 
-from src.core import Scene
+from src.core import FixedTimestep, InputHandler, Scene
+from src.logs import init_logging
+from src.profiling import OVERLAY_KEY, FrameTimes, ProfilingOverlay
+from src.replay import EventPlayer, EventRecorder, load_recording
 from src.scenes.locale_selection_scene import LocaleSelectionScene
-from src.settings import FPS, GAME_NAME, LOCALES, LOGS_FILE, WINDOW_SIZE
+from src.settings import (
+    EXPORT_FRAME_TIMES,
+    FIXED_TIMESTEP,
+    FPS,
+    FRAME_TIMES_EXPORT_PERIOD,
+    FRAME_TIMES_FILE,
+    GAME_NAME,
+    LOCALES,
+    MAX_UPDATE_STEPS,
+    RENDER_SIZE,
+    TICK_RATE,
+    WINDOW_SIZE,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class Game:
-    def __init__(self):
-        logging.basicConfig(
-            filename=LOGS_FILE,
-            level=logging.DEBUG,
-            format="{asctime} {filename:<15s} l{lineno:<4d} {levelname:<8s} {message}",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            style="{",
-        )
+    # window events refer to it, kept while the window exists (not per game)
+    _window: Window | None = None
+
+    def __init__(
+        self,
+        fixed_timestep: bool = FIXED_TIMESTEP,
+        tick_rate: int = TICK_RATE,
+        max_update_steps: int = MAX_UPDATE_STEPS,
+        export_frame_times: bool = EXPORT_FRAME_TIMES,
+    ):
+        init_logging()
+        # settings which must be identical to replay a recording
+        self._settings = {
+            "fixed_timestep": fixed_timestep,
+            "tick_rate": tick_rate,
+            "max_update_steps": max_update_steps,
+        }
         pygame.init()
         pygame.mouse.set_visible(0)
-        self._screen = pygame.display.set_mode(WINDOW_SIZE)
+        self._screen = pygame.display.get_surface()
+        # an existing window is reused (SCALED windows renderer cannot be recreated)
+        if self._screen is None or self._screen.get_size() != RENDER_SIZE:
+            # scenes draw at RENDER_SIZE, SDL scales frames to the window once
+            if RENDER_SIZE == WINDOW_SIZE:
+                self._screen = pygame.display.set_mode(RENDER_SIZE)
+            else:
+                self._screen = pygame.display.set_mode(RENDER_SIZE, pygame.SCALED)
+                # SCALED picks the window size from the desktop one, not WINDOW_SIZE
+                Game._window = Window.from_display_module()
+                Game._window.size = WINDOW_SIZE
         pygame.display.set_caption(GAME_NAME)
         self._scene_queue = queue.Queue()
         self._scene: Scene = LocaleSelectionScene(LOCALES, self._scene_queue)
         self._clock = pygame.time.Clock()
+        self._timestep = (
+            FixedTimestep(tick_rate, max_update_steps) if fixed_timestep else None
+        )
+        self._frame_times = FrameTimes()
+        self._export_frame_times_enabled = export_frame_times
+        self._export_time = 0  # ms since last frame times export
+        self._overlay = ProfilingOverlay(self._frame_times)
+        InputHandler.global_key_down_callbacks[OVERLAY_KEY] = self._toggle_overlay
+        # renderers only redraw what changed, window content is lost when exposed
+        for event_type in (
+            pygame.WINDOWEXPOSED,
+            pygame.WINDOWRESTORED,
+            pygame.VIDEOEXPOSE,
+        ):
+            InputHandler.global_event_callbacks[event_type] = self._redraw
+
+    def run(self, record: str | pathlib.Path | None = None):
+        """when record is set, frames dt and input events are recorded to this file"""
+        logger.debug("Run the game")
+        if record is None:
+            while 1:
+                dt = self._clock.tick(FPS)  # delta time in milliseconds
+                self._run_frame(dt)
+        with open(record, "w") as f:
+            recorder = EventRecorder(f, self._settings)
+            InputHandler.event_source = recorder.get_events
+            try:
+                while 1:
+                    dt = self._clock.tick(FPS)
+                    recorder.end_frame(dt, self._run_frame(dt))
+            finally:
+                InputHandler.event_source = None
 
-    def run(self):
-        logging.debug("Run the game")
-        while 1:
-            dt = self._clock.tick(FPS)  # delta time in milliseconds
-            if not self._scene_queue.empty():
-                # update scene
-                self._scene = self._scene_queue.get()
-            self._scene.handle_inputs()
+    def replay(self, filename: str | pathlib.Path) -> int:
+        """
+        run a recording made with run(record=...) as fast as possible
+        return the number of replayed frames
+        """
+        logger.debug("Replay '%s'", filename)
+        settings, frames = load_recording(filename)
+        if settings != self._settings:
+            raise ValueError(f"recording requires Game(**{settings})")
+        player = EventPlayer(frames)
+        InputHandler.event_source = player.get_events
+        try:
+            for frame in player:
+                self._run_frame(frame.dt, frame.scene_switch)
+        finally:
+            InputHandler.event_source = None
+        return len(player)
+
+    def _run_frame(self, dt: int, scene_switch: bool | None = None) -> bool:
+        """
+        scene_switch forces switching (or not) to the queued scene (replays)
+        return whether scene was switched
+        """
+        if scene_switch is None:
+            scene_switch = not self._scene_queue.empty()
+        elif scene_switch and self._scene_queue.empty():
+            # scene was ready sooner when recording (eg. assets loaded on a thread)
+            self._scene.wait()
+        if scene_switch:
+            # update scene
+            self._scene = self._scene_queue.get_nowait()
+        start = time.perf_counter()
+        self._scene.handle_inputs()
+        inputs_end = time.perf_counter()
+        if self._timestep is None:
+            # variable timestep: simulate the whole frame time at once
             self._scene.update(dt)
+            update_end = time.perf_counter()
             self._scene.render(self._screen)
+        else:
+            for _ in range(self._timestep.advance(dt)):
+                self._scene.update(self._timestep.step)
+            update_end = time.perf_counter()
+            self._scene.render(self._screen, self._timestep.alpha)
+        end = time.perf_counter()
+        self._frame_times.record(
+            (inputs_end - start) * 1000,
+            (update_end - inputs_end) * 1000,
+            (end - update_end) * 1000,
+        )
+        if self._overlay.visible:
+            self._overlay.draw(self._screen, dt)
+        self._export_frame_times(dt)
+        return scene_switch
+
+    def _toggle_overlay(self, *args, **kwargs):
+        self._overlay.toggle()
+        if not self._overlay.visible:
+            # erase overlay
+            self._scene.invalidate()
+
+    def _redraw(self, *args, **kwargs):
+        self._scene.invalidate()
+
+    def _export_frame_times(self, dt: int):
+        if not self._export_frame_times_enabled:
+            return
+        self._export_time += dt
+        if self._export_time >= FRAME_TIMES_EXPORT_PERIOD:
+            self._frame_times.export(FRAME_TIMES_FILE)
+            self._export_time = 0
@@ -1,34 +1,378 @@
+import collections
+import concurrent.futures
 import functools
+import json
 import logging
+import math
+import multiprocessing
 import pathlib
+import types
 from enum import Enum
-from typing import List
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Tuple
 
+import numpy as np
 import pygame
 
-from src.settings import FONTS_DIR, IMAGES_DIR, SOUNDS_DIR
+from src.bundle import BufferReader, get_asset_size, get_asset_source, read_asset
+from src.settings import (
+    ASSET_CACHE_MAX_BYTES,
+    ATLASES_DIR,
+    FONTS_DIR,
+    IMAGE_DECODE_PROCESSES,
+    IMAGE_DECODE_WORKERS,
+    IMAGES_DIR,
+    MIRROR_ANIMATIONS,
+    OPTIMIZE_IMAGE_FORMATS,
+    SCALED_IMAGE_CACHE_SIZE,
+    SOUNDS_DIR,
+    TEXT_CACHE_SIZE,
+    USE_TEXTURE_ATLAS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AssetCache:
+    """
+    LRU cache of loaded assets bounded by their size in memory (in bytes)
+    sizeof returns an asset size, or the sizes of the memory blocks it references
+    ({block: size}) when they may be shared by other assets (eg. an atlas surface):
+    a block is counted once, until the last asset referencing it is evicted
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: collections.OrderedDict[
+            Hashable, Tuple[Any, Mapping[Hashable, int]]
+        ] = collections.OrderedDict()
+        # block -> [size, number of entries referencing it]
+        self._blocks: Dict[Hashable, List[int]] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        sizeof: Callable[[Any], int | Mapping[Hashable, int]],
+    ) -> Any:
+        """return cached asset, load it if missing"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+        self._misses += 1
+        asset = load()
+        size = sizeof(asset)
+        blocks = size if isinstance(size, Mapping) else {key: size}
+        self._entries[key] = (asset, blocks)
+        for block, block_size in blocks.items():
+            self._acquire(block, block_size)
+        # always keep the last loaded asset, even if it does not fit in the budget
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            _, (_, evicted_blocks) = self._entries.popitem(last=False)
+            for block in evicted_blocks:
+                self._release(block)
+            self._evictions += 1
+        return asset
+
+    def _acquire(self, block: Hashable, size: int):
+        if block in self._blocks:
+            self._blocks[block][1] += 1
+        else:
+            self._blocks[block] = [size, 1]
+            self._bytes += size
+
+    def _release(self, block: Hashable):
+        entry = self._blocks[block]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._blocks[block]
+            self._bytes -= entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def clear(self):
+        self._entries.clear()
+        self._blocks.clear()
+        self._bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+        }
+
+
+asset_cache = AssetCache(ASSET_CACHE_MAX_BYTES)
+
+
+class ImageFormat(Enum):
+    OPAQUE = 0  # no transparency: convert()
+    COLORKEY = 1  # only fully transparent or opaque pixels: convert() and RLE colorkey
+    ALPHA = 2  # per pixel alpha: convert_alpha()
+
+
+# assets read and decoded on a background thread, waiting to be loaded on main thread
+_preloaded_fonts: Dict[Tuple[pathlib.Path, int], memoryview] = {}
+_preloaded_images: Dict[
+    pathlib.Path, Tuple[pygame.Surface, ImageFormat, Tuple[int, int, int] | None]
+] = {}
+
+
+def _sizeof_surface(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+def _sizeof_surfaces(surfaces: Iterable[pygame.Surface]) -> Dict[pygame.Surface, int]:
+    """
+    memory blocks kept alive by surfaces (a subsurface keeps its whole parent alive),
+    shared with other cached assets (see AssetCache)
+    """
+    parents = {surface.get_abs_parent() for surface in surfaces}
+    return {parent: _sizeof_surface(parent) for parent in parents}
+
+
+def _sizeof_sound(sound: pygame.mixer.Sound) -> int:
+    frequency, fmt, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(fmt) // 8)
 
 
 def load_font(filename: str | pathlib.Path, size: int) -> pygame.font.Font:
     """Load font from file"""
     fullpath = FONTS_DIR / filename
-    logging.info(f"Load font '{fullpath}' with size {size}")
-    return pygame.font.Font(fullpath, size)
+
+    def load():
+        logger.info("Load font '%s' with size %d", fullpath, size)
+        data = _preloaded_fonts.pop((fullpath, size), None)
+        source = get_asset_source(fullpath) if data is None else BufferReader(data)
+        return pygame.font.Font(source, size)
+
+    # font memory usage is approximated by its file size
+    return asset_cache.get(
+        ("font", fullpath, size), load, lambda _: get_asset_size(fullpath)
+    )
+
+
+# colorkeys tried in order, the first one no opaque pixel uses is selected
+_COLORKEYS = ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3))
+# formats images were converted to: image path -> format
+image_formats: Dict[pathlib.Path, ImageFormat] = {}
+
+
+def detect_image_format(
+    surface: pygame.Surface,
+) -> Tuple[ImageFormat, Tuple[int, int, int] | None]:
+    """fastest format to blit surface without visual change and its colorkey"""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        colorkey = surface.get_colorkey()
+        if colorkey is None:
+            return ImageFormat.OPAQUE, None
+        return ImageFormat.COLORKEY, tuple(colorkey[:3])
+    pixels = np.frombuffer(pygame.image.tobytes(surface, "RGBA"), dtype=np.uint8)
+    pixels = pixels.reshape(-1, 4)
+    opaque = pixels[:, 3] == 255
+    if opaque.all():
+        return ImageFormat.OPAQUE, None
+    if not (opaque | (pixels[:, 3] == 0)).all():
+        return ImageFormat.ALPHA, None
+    rgb = pixels[opaque, :3].astype(np.uint32)
+    colors = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    for r, g, b in _COLORKEYS:
+        if not (colors == (r << 16) | (g << 8) | b).any():
+            return ImageFormat.COLORKEY, (r, g, b)
+    return ImageFormat.ALPHA, None
+
+
+def _convert_image(
+    surface: pygame.Surface,
+    image_format: ImageFormat,
+    colorkey: Tuple[int, int, int] | None,
+) -> pygame.Surface:
+    if image_format is ImageFormat.OPAQUE:
+        return surface.convert()
+    if image_format is ImageFormat.ALPHA:
+        return surface.convert_alpha()
+    image = surface.convert()
+    if surface.get_flags() & pygame.SRCALPHA:
+        # transparent pixels are set to the colorkey (alpha is binary, so this is
+        # what blitting surface on a colorkey filled image gives, without blending)
+        transparent = pygame.surfarray.pixels_alpha(surface) == 0
+        pygame.surfarray.pixels2d(image)[transparent] = image.map_rgb(colorkey)
+    image.set_colorkey(colorkey, pygame.RLEACCEL)
+    return image
+
+
+def optimize_surface(surface: pygame.Surface) -> pygame.Surface:
+    """
+    convert a per pixel alpha surface (eg. rendered by the game) to the fastest
+    format to blit it, as images are (see detect_image_format)
+    """
+    return _convert_image(surface, *_get_image_format(surface))
 
 
-@functools.lru_cache(256)
 def load_image(filename: str | pathlib.Path) -> pygame.Surface:
     """Load an image from filesystem"""
     fullpath = IMAGES_DIR / filename
-    logging.info(f"Load image '{fullpath}'")
-    return pygame.image.load(fullpath).convert_alpha()
+
+    def load():
+        staged = _preloaded_images.pop(fullpath, None)
+        if staged is not None:
+            surface, image_format, colorkey = staged
+        else:
+            surface = pygame.image.load(get_asset_source(fullpath), fullpath.name)
+            image_format, colorkey = _get_image_format(surface)
+        logger.info("Load image '%s' (%s)", fullpath, image_format.name)
+        image_formats[fullpath] = image_format
+        return _convert_image(surface, image_format, colorkey)
+
+    return asset_cache.get(
+        ("image", fullpath), load, lambda image: _sizeof_surfaces((image,))
+    )
+
+
+def _get_image_format(
+    surface: pygame.Surface,
+) -> Tuple[ImageFormat, Tuple[int, int, int] | None]:
+    if not OPTIMIZE_IMAGE_FORMATS:
+        return ImageFormat.ALPHA, None
+    return detect_image_format(surface)
+
+
+def preload_font(filename: str | pathlib.Path, size: int):
+    """Read font file so that load_font does no I/O (thread safe)"""
+    fullpath = FONTS_DIR / filename
+    if ("font", fullpath, size) in asset_cache:
+        return
+    logger.debug("Preload font '%s' with size %d", fullpath, size)
+    _preloaded_fonts[(fullpath, size)] = memoryview(read_asset(fullpath))
+
+
+def preload_image(filename: str | pathlib.Path):
+    """
+    Read, decode and analyze image so that load_image only converts it (thread safe)
+    conversion to display pixel format must happen on main thread
+    """
+    fullpath = IMAGES_DIR / filename
+    if ("image", fullpath) in asset_cache:
+        return
+    logger.debug("Preload image '%s'", fullpath)
+    surface = pygame.image.load(get_asset_source(fullpath), fullpath.name)
+    # format detection does not require a display, it is done here too
+    _preloaded_images[fullpath] = (surface, *_get_image_format(surface))
+
+
+def _decode_image(
+    fullpath: pathlib.Path,
+) -> Tuple[bytes, Tuple[int, int], ImageFormat, Tuple[int, int, int] | None]:
+    """decode image to RGBA pixels and detect its format (runs in a worker)"""
+    surface = pygame.image.load(get_asset_source(fullpath), fullpath.name)
+    image_format, colorkey = _get_image_format(surface)
+    pixels = pygame.image.tobytes(surface, "RGBA")
+    return pixels, surface.get_size(), image_format, colorkey
+
+
+def preload_images(
+    filenames: Iterable[str | pathlib.Path],
+    on_preloaded: Callable[[], None] | None = None,
+    workers: int | None = IMAGE_DECODE_WORKERS,
+    processes: bool = IMAGE_DECODE_PROCESSES,
+):
+    """
+    Decode images in parallel so that load_image only converts them (thread safe)
+    images are decoded by a pool of workers threads (or processes) to RGBA pixels,
+    surfaces are built from these pixels by the calling thread
+    on_preloaded is called after each image is preloaded (in filenames order),
+    already loaded images are skipped and called back for first
+    """
+    fullpaths = []
+    for filename in filenames:
+        fullpath = IMAGES_DIR / filename
+        if ("image", fullpath) not in asset_cache:
+            fullpaths.append(fullpath)
+        elif on_preloaded is not None:
+            on_preloaded()
+    if not fullpaths:
+        return
+    if processes:
+        # workers import the game modules, fork is not safe with running threads
+        executor = concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+    with executor:
+        logger.debug("Preload %d images", len(fullpaths))
+        decoded = executor.map(_decode_image, fullpaths)
+        for fullpath, (pixels, size, image_format, colorkey) in zip(
+            fullpaths, decoded
+        ):
+            surface = pygame.image.frombuffer(pixels, size, "RGBA")
+            _preloaded_images[fullpath] = (surface, image_format, colorkey)
+            if on_preloaded is not None:
+                on_preloaded()
+
+
+def load_images(filenames: Iterable[str | pathlib.Path]) -> List[pygame.Surface]:
+    """Load images from filesystem, decoding them in parallel (see preload_images)"""
+    filenames = list(filenames)
+    preload_images(filenames)
+    return [load_image(filename) for filename in filenames]
 
 
 def load_sound(filename: str | pathlib.Path) -> pygame.mixer.Sound:
     """Load sound from filesystem"""
     fullpath = SOUNDS_DIR / filename
-    logging.info(f"Load sound '{fullpath}'")
-    return pygame.mixer.Sound(fullpath)
+
+    def load():
+        logger.info("Load sound '%s'", fullpath)
+        return pygame.mixer.Sound(get_asset_source(fullpath))
+
+    return asset_cache.get(("sound", fullpath), load, _sizeof_sound)
+
+
+def _load_atlas_index(name: str) -> Dict[str, Any]:
+    return json.loads(bytes(read_asset(ATLASES_DIR / f"{name}.json")))
+
+
+def _copy_rle(frame: pygame.Surface) -> pygame.Surface:
+    image = frame.copy()
+    image.set_colorkey(frame.get_colorkey(), pygame.RLEACCEL)
+    return image
+
+
+def load_atlas(name: str) -> Dict[str, pygame.Surface]:
+    """
+    Load a texture atlas, frames are subsurfaces of the atlas image
+    SDL cannot RLE blit subsurfaces: frames of a colorkey atlas are copied to their
+    own RLE surfaces instead (their blit is about 4x faster)
+    """
+    fullpath = ATLASES_DIR / f"{name}.json"
+
+    def load():
+        logger.info("Load atlas '%s'", fullpath)
+        index = _load_atlas_index(name)
+        atlas = load_image(ATLASES_DIR.relative_to(IMAGES_DIR) / index["image"])
+        frames = {
+            frame: atlas.subsurface(pygame.Rect(rect))
+            for frame, rect in index["frames"].items()
+        }
+        if atlas.get_colorkey() is None:
+            return frames
+        return {frame: _copy_rle(image) for frame, image in frames.items()}
+
+    return asset_cache.get(
+        ("atlas", fullpath), load, lambda atlas: _sizeof_surfaces(atlas.values())
+    )
 
 
 class Sprite(pygame.sprite.Sprite):
@@ -38,6 +382,145 @@ class Sprite(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
 
 
+@functools.lru_cache(TEXT_CACHE_SIZE)
+def _render_text(
+    text: str,
+    font_name: str | pathlib.Path,
+    font_size: int,
+    color: Tuple[int, int, int, int],
+    antialias: bool,
+) -> pygame.Surface:
+    return load_font(font_name, font_size).render(text, antialias, color)
+
+
+def render_text(
+    text: str,
+    font_name: str | pathlib.Path,
+    font_size: int,
+    color: pygame.Color,
+    antialias=True,
+) -> pygame.Surface:
+    """Render text with font, rendered surfaces are cached (do not draw on them)"""
+    return _render_text(text, font_name, font_size, tuple(color), antialias)
+
+
+def render_glyphs(
+    text: str,
+    font_name: str | pathlib.Path,
+    font_size: int,
+    color: pygame.Color,
+    antialias=True,
+) -> pygame.Surface:
+    """
+    Render text by composing cached character surfaces
+    (for text which changes often eg. counters, does not handle kerning)
+    """
+    glyphs = [render_text(c, font_name, font_size, color, antialias) for c in text]
+    width = sum(g.get_width() for g in glyphs)
+    height = load_font(font_name, font_size).get_height()
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    x = 0
+    for glyph in glyphs:
+        # copy glyph pixels as is instead of blending them on the transparent image
+        image.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        x += glyph.get_width()
+    return image
+
+
+@functools.lru_cache(SCALED_IMAGE_CACHE_SIZE)
+def _scale_image(image: pygame.Surface, scale: float) -> pygame.Surface:
+    scaled = pygame.transform.scale_by(image, scale)
+    colorkey = image.get_colorkey()
+    if colorkey is not None:
+        scaled.set_colorkey(colorkey, pygame.RLEACCEL)
+    return scaled
+
+
+class Camera:
+    """
+    view of the world following a target, converts world to screen coordinates
+    size is the screen size, the world is drawn scaled by scale (eg. UI_SCALE) so
+    that the view is size / scale world pixels whatever the render resolution
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        bounds: pygame.Rect | None = None,
+        target: pygame.sprite.Sprite | None = None,
+        scale: float = 1.0,
+    ):
+        view_size = (round(size[0] / scale), round(size[1] / scale))
+        self._view = pygame.Rect((0, 0), view_size)
+        self._bounds = bounds  # view stays inside bounds (eg. level rect)
+        self._target = target
+        self._scale = scale
+
+    @property
+    def view(self) -> pygame.Rect:
+        """visible part of the world"""
+        return self._view
+
+    def follow(self, target: pygame.sprite.Sprite | None):
+        self._target = target
+
+    def update(self, center: Tuple[int, int] | None = None):
+        """center view on center (target rect center by default)"""
+        if center is None and self._target is not None:
+            center = self._target.rect.center
+        if center is not None:
+            self._view.center = center
+        if self._bounds is not None:
+            self._view.clamp_ip(self._bounds)
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    def to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        if self._scale == 1:
+            return rect.move(-self._view.x, -self._view.y)
+        s = self._scale
+        # floored from world origin: sprites do not jitter relative to the tiles
+        return pygame.Rect(
+            math.floor(rect.x * s) - math.floor(self._view.x * s),
+            math.floor(rect.y * s) - math.floor(self._view.y * s),
+            math.ceil(rect.width * s),
+            math.ceil(rect.height * s),
+        )
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        return self._view.colliderect(rect)
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        sprites: Iterable[pygame.sprite.Sprite],
+        rects: Mapping[pygame.sprite.Sprite, pygame.Rect] | None = None,
+    ) -> int:
+        """
+        draw visible sprites, return number of drawn sprites
+        sprites may come from a spatial query of the view to avoid checking them all
+        rects overrides where some sprites are drawn (eg. interpolated positions)
+        """
+        x, y, view = self._view.x, self._view.y, self._view
+        rects = {} if rects is None else rects
+        if self._scale == 1:
+            blits = [
+                (s.image, r.move(-x, -y))
+                for s in sprites
+                if view.colliderect(r := rects.get(s, s.rect))
+            ]
+        else:
+            blits = [
+                (_scale_image(s.image, self._scale), self.to_screen(r))
+                for s in sprites
+                if view.colliderect(r := rects.get(s, s.rect))
+            ]
+        screen.blits(blits, doreturn=False)
+        return len(blits)
+
+
 class FontSprite(Sprite):
     def __init__(
         self,
@@ -46,10 +529,23 @@ class FontSprite(Sprite):
         font_size: int,
         color: pygame.Color,
         *groups: List[pygame.sprite.Group],
+        glyphs=False,
     ):
-        font = load_font(font_name, font_size)
-        image = font.render(text, True, color)
-        super().__init__(image, *groups)
+        # glyphs: compose text from cached characters, for text which changes often
+        self._font_name = font_name
+        self._font_size = font_size
+        self._color = color
+        self._glyphs = glyphs
+        super().__init__(self._render(text), *groups)
+
+    def set_text(self, text: str):
+        """update rendered text, sprite keeps its top left position"""
+        self.image = self._render(text)
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
+
+    def _render(self, text: str) -> pygame.Surface:
+        render = render_glyphs if self._glyphs else render_text
+        return render(text, self._font_name, self._font_size, self._color)
 
 
 class Direction(Enum):
@@ -63,88 +559,211 @@ class PlayerState(Enum):
     JUMP = 2
 
 
+def _get_frame_names(animation: str, direction: Direction, count: int) -> List[str]:
+    return [
+        f"{animation}/{animation}-{direction.name.lower()}-{i + 1}"
+        for i in range(count)
+    ]
+
+
+def get_animation_images(
+    character: str,
+    animation: str,
+    direction: Direction,
+    count: int,
+    mirror: bool = MIRROR_ANIMATIONS,
+) -> List[pathlib.Path]:
+    """images read by load_animation_frames (eg. to preload them)"""
+    if mirror:
+        # mirrored frames are derived from right facing ones
+        direction = Direction.RIGHT
+    names = _get_frame_names(animation, direction, count)
+    images = []
+    if USE_TEXTURE_ATLAS:
+        index = _load_atlas_index(character)
+        images.append(ATLASES_DIR.relative_to(IMAGES_DIR) / index["image"])
+        names = [name for name in names if name not in index["frames"]]
+    return images + [pathlib.Path(character, f"{name}.png") for name in names]
+
+
+def load_animation_frames(
+    character: str,
+    animation: str,
+    direction: Direction,
+    count: int,
+    mirror: bool = MIRROR_ANIMATIONS,
+) -> Tuple[pygame.Surface]:
+    """
+    Load animation frames of a character
+    (eg. 'player/idle/idle-left-1.png' to 'player/idle/idle-left-4.png')
+    if mirror is True, left facing frames are derived from right facing ones
+    """
+
+    def load():
+        if mirror and direction != Direction.RIGHT:
+            # mirrored frames are flipped once and cached alongside the loaded ones
+            source = load_animation_frames(
+                character, animation, Direction.RIGHT, count, mirror
+            )
+            return tuple(pygame.transform.flip(f, True, False) for f in source)
+        names = _get_frame_names(animation, direction, count)
+        atlas = load_atlas(character) if USE_TEXTURE_ATLAS else {}
+        # frames missing from the atlas fall back to loose images (decoded in parallel)
+        missing = [name for name in names if name not in atlas]
+        if not missing:
+            return tuple(atlas[name] for name in names)
+        images = dict(
+            zip(
+                missing,
+                load_images(
+                    pathlib.Path(character, f"{name}.png") for name in missing
+                ),
+            )
+        )
+        return tuple(atlas[name] if name in atlas else images[name] for name in names)
+
+    key = ("animation", character, animation, direction, count, mirror)
+    return asset_cache.get(key, load, _sizeof_surfaces)
+
+
 class PlayerAnimationHandler:
+    __slots__ = (
+        "_animations",
+        "_state",
+        "_direction",
+        "_animation_time",
+        "_frames",
+        "_animation_fq",
+        "_next_frame_time",
+        "_image",
+    )
+
     # animations per second depending on player state
     ANIMATIONS_FQ_STATE = {
         PlayerState.IDLE.value: 10,
         PlayerState.JUMP.value: 18,
         PlayerState.RUN.value: 12,
     }
+    # number of animation frames depending on player state
+    ANIMATIONS_FRAMES_STATE = {
+        PlayerState.IDLE.value: 4,
+        PlayerState.JUMP.value: 4,
+        PlayerState.RUN.value: 8,
+    }
 
     def __init__(
-        self, state=PlayerState.IDLE, direction=Direction.RIGHT, animation_time=0
+        self,
+        state=PlayerState.IDLE,
+        direction=Direction.RIGHT,
+        animation_time=0,
+        character="player",
     ) -> None:
-        self._state_direction_images = [None] * len(PlayerState)
-        # contains 2 list of images for each PlayerState, one for left and one for right direction
-        self._state_direction_images[PlayerState.IDLE.value] = [
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "idle", f"idle-left-{i+1}.png")
-                    for i in range(4)
-                ]
-            ],
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "idle", f"idle-right-{i+1}.png")
-                    for i in range(4)
-                ]
-            ],
-        ]
-        self._state_direction_images[PlayerState.RUN.value] = [
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "run", f"run-left-{i+1}.png")
-                    for i in range(8)
-                ]
-            ],
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "run", f"run-right-{i+1}.png")
-                    for i in range(8)
-                ]
-            ],
-        ]
-        self._state_direction_images[PlayerState.JUMP.value] = [
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "jump", f"jump-left-{i + 1}.png")
-                    for i in range(4)
-                ]
-            ],
-            [
-                load_image(filename)
-                for filename in [
-                    pathlib.Path("player", "jump", f"jump-right-{i + 1}.png")
-                    for i in range(4)
-                ]
-            ],
-        ]
+        self._animations = self.get_animations(character)
         self._state = state
         self._direction = direction
         self._animation_time = animation_time  # in milliseconds
-
-    def update(self, new_state: PlayerState, new_direction: Direction, dt: int):
+        self._select_animation()
+
+    @classmethod
+    def get_animations(
+        cls, character: str
+    ) -> Mapping[Tuple[PlayerState, Direction], Tuple[pygame.Surface]]:
+        """
+        build character animations once (cached in asset_cache), they are shared by
+        every instance
+        """
+
+        def load():
+            return types.MappingProxyType(
+                {
+                    (s, d): load_animation_frames(
+                        character,
+                        s.name.lower(),
+                        d,
+                        cls.ANIMATIONS_FRAMES_STATE[s.value],
+                    )
+                    for s in PlayerState
+                    for d in Direction
+                }
+            )
+
+        return asset_cache.get(
+            ("animations", character),
+            load,
+            lambda animations: _sizeof_surfaces(
+                frame for frames in animations.values() for frame in frames
+            ),
+        )
+
+    @classmethod
+    def get_images(cls, character: str) -> List[pathlib.Path]:
+        """images read to build character animations (eg. to preload them)"""
+        images = (
+            image
+            for s in PlayerState
+            for d in Direction
+            for image in get_animation_images(
+                character, s.name.lower(), d, cls.ANIMATIONS_FRAMES_STATE[s.value]
+            )
+        )
+        return list(dict.fromkeys(images))
+
+    def update(
+        self, new_state: PlayerState, new_direction: Direction, dt: int
+    ) -> bool:
+        """advance animation, return whether image changed"""
         if self._state != new_state or self._direction != new_direction:
             # player animation update
             self._animation_time = 0
             self._state = new_state
             self._direction = new_direction
-        else:
-            self._animation_time += dt
+            self._select_animation()
+            return True
+        self._animation_time += dt
+        if self._animation_time < self._next_frame_time:
+            return False
+        self._select_frame()
+        return True
 
     @property
     def image(self) -> pygame.Surface:
-        images = self._state_direction_images[self._state.value][self._direction.value]
-        animation_fq = self.ANIMATIONS_FQ_STATE[self._state.value]
-        return images[int(self._animation_time * animation_fq / 1000) % len(images)]
+        return self._image
 
+    @property
+    def time_to_next_frame(self) -> float:
+        """milliseconds before image changes (if state and direction do not change)"""
+        return self._next_frame_time - self._animation_time
+
+    def _select_animation(self):
+        self._frames = self._animations[(self._state, self._direction)]
+        self._animation_fq = self.ANIMATIONS_FQ_STATE[self._state.value]
+        self._select_frame()
+
+    def _select_frame(self):
+        # cache current frame and the animation time at which the next one starts
+        frame = int(self._animation_time * self._animation_fq / 1000)
+        self._image = self._frames[frame % len(self._frames)]
+        self._next_frame_time = (frame + 1) * 1000 / self._animation_fq
+
+
+class PlayerBody:
+    """
+    player physics and animation without pygame.sprite.Sprite group bookkeeping
+    attributes are slots (no per instance __dict__), use it for many entities
+    """
+
+    __slots__ = (
+        "_vx",
+        "_vy",
+        "_available_jumps",
+        "_x_remainder",
+        "_y_remainder",
+        "_sprite_sheet",
+        "_direction",
+        "image",
+        "rect",
+    )
 
-class PlayerSprite(Sprite):
     jump_vy = -500  # pixels per second
     max_available_jumps = 2
     max_vx_speed = 500  # pixels per second
@@ -156,14 +775,17 @@ class PlayerSprite(Sprite):
         vy: int = 0,
         available_jumps: int = max_available_jumps,
         direction=Direction.RIGHT,
-        *groups: List[pygame.sprite.Group],
     ):
         self._vx = vx
         self._vy = vy
         self._available_jumps = available_jumps
+        # sub-pixel position (rect coordinates are integers), see sub_pixel
+        self._x_remainder = 0.0
+        self._y_remainder = 0.0
         self._sprite_sheet = PlayerAnimationHandler(self.state)
         self._direction = direction
-        super().__init__(self._sprite_sheet.image, *groups)
+        self.image = self._sprite_sheet.image
+        self.rect = self.image.get_rect()
 
     def jump(self):
         if self._available_jumps <= 0:
@@ -182,11 +804,34 @@ class PlayerSprite(Sprite):
     def stop_horizontal_movement(self):
         self._vx = 0
 
+    def get_displacement(self, dt: float) -> Tuple[float, float]:
+        """
+        pixels moved during dt milliseconds, falling included (call it before
+        apply_gravity): exact for any dt, so movement does not depend on tick rate
+        """
+        t = dt / 1000
+        return self._vx * t, self._vy * t + self.weight * t * t / 2
+
+    @property
+    def sub_pixel(self) -> Tuple[float, float]:
+        """position not applied to rect yet, in [0, 1) pixel on each axis"""
+        return self._x_remainder, self._y_remainder
+
+    @sub_pixel.setter
+    def sub_pixel(self, value: Tuple[float, float]):
+        self._x_remainder, self._y_remainder = value
+
     def update_horizontal_pos(self, dt: int):
-        self.rect.centerx += self._vx * dt / 1000
+        """move without collisions (see CollisionWorld.move_sprite otherwise)"""
+        x = self.rect.x + self._x_remainder + self._vx * dt / 1000
+        self.rect.x = math.floor(x)
+        self._x_remainder = x - self.rect.x
 
     def update_vertical_pos(self, dt: int):
-        self.rect.centery += self._vy * dt / 1000
+        """move without collisions (see CollisionWorld.move_sprite otherwise)"""
+        y = self.rect.y + self._y_remainder + self._vy * dt / 1000
+        self.rect.y = math.floor(y)
+        self._y_remainder = y - self.rect.y
 
     def apply_gravity(self, dt: int):
         self._vy += self.weight * dt / 1000
@@ -207,6 +852,24 @@ class PlayerSprite(Sprite):
         else:
             return PlayerState.RUN
 
-    def update_image(self, dt: int):
-        self._sprite_sheet.update(self.state, self._direction, dt)
+    def update_image(self, dt: int) -> bool:
+        """advance animation, return whether image changed"""
+        if not self._sprite_sheet.update(self.state, self._direction, dt):
+            return False
         self.image = self._sprite_sheet.image
+        return True
+
+
+class PlayerSprite(pygame.sprite.Sprite, PlayerBody):
+    """PlayerBody which can be added to sprite groups"""
+
+    def __init__(
+        self,
+        vx: int = 0,
+        vy: int = 0,
+        available_jumps: int = PlayerBody.max_available_jumps,
+        direction=Direction.RIGHT,
+        *groups: List[pygame.sprite.Group],
+    ):
+        PlayerBody.__init__(self, vx, vy, available_jumps, direction)
+        pygame.sprite.Sprite.__init__(self, *groups)
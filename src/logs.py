@@ -0,0 +1,72 @@
+import atexit
+import logging
+import logging.handlers
+import pathlib
+import queue
+from typing import Mapping
+
+from src.settings import ASYNC_LOGGING, LOG_LEVEL, LOG_LEVELS, LOGS_FILE
+
+LOG_FORMAT = "{asctime} {filename:<15s} l{lineno:<4d} {levelname:<8s} {message}"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# handler and listener installed by the last init_logging call
+_handler: logging.Handler | None = None
+_listener: logging.handlers.QueueListener | None = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """queue records as is, messages are formatted by the QueueListener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def init_logging(
+    filename: str | pathlib.Path = LOGS_FILE,
+    level: int = LOG_LEVEL,
+    levels: Mapping[str, int] = LOG_LEVELS,
+    async_logging: bool = ASYNC_LOGGING,
+):
+    """
+    log to filename, levels maps subsystems (logger names, eg. 'src.graphics') to
+    their own log level
+    with async_logging, the calling thread only queues records: they are formatted and
+    written to filename on a background thread
+    """
+    global _handler, _listener
+    stop_logging()
+    root = logging.getLogger()
+    root.setLevel(level)
+    for name, subsystem_level in levels.items():
+        logging.getLogger(name).setLevel(subsystem_level)
+    file_handler = logging.FileHandler(filename)
+    file_handler.setFormatter(
+        logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT, style="{")
+    )
+    if not async_logging:
+        _handler = file_handler
+    else:
+        log_queue = queue.SimpleQueue()
+        _handler = DeferredQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _listener.start()
+    root.addHandler(_handler)
+
+
+def stop_logging():
+    """flush queued records and remove handlers installed by init_logging"""
+    global _handler, _listener
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# queued records are written before the interpreter exits
+atexit.register(stop_logging)
@@ -0,0 +1,155 @@
+from typing import List, Tuple
+
+import numpy as np
+import pygame
+
+from src.graphics import Direction, PlayerSprite, PlayerState
+
+
+class EntityStore:
+    """
+    physics bodies behaving like PlayerSprite stored as a structure of arrays
+    gravity, integration and state derivation run as batched numpy operations
+    positions are floats (top left, in pixels), rects are only synced for drawing
+    """
+
+    def __init__(
+        self,
+        capacity=64,
+        weight=PlayerSprite.weight,
+        jump_vy=PlayerSprite.jump_vy,
+        max_available_jumps=PlayerSprite.max_available_jumps,
+    ):
+        self._count = 0
+        self._weight = weight
+        self._jump_vy = jump_vy
+        self._max_available_jumps = max_available_jumps
+        self._pos = np.zeros((capacity, 2), dtype=np.float64)
+        self._vel = np.zeros((capacity, 2), dtype=np.float64)
+        self._available_jumps = np.zeros(capacity, dtype=np.int16)
+        self._states = np.zeros(capacity, dtype=np.int8)
+        self._directions = np.zeros(capacity, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._pos[: self._count]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._vel[: self._count]
+
+    @property
+    def available_jumps(self) -> np.ndarray:
+        return self._available_jumps[: self._count]
+
+    @property
+    def states(self) -> np.ndarray:
+        """PlayerState values, derived from velocities by step"""
+        return self._states[: self._count]
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Direction values, derived from horizontal velocities by step"""
+        return self._directions[: self._count]
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        vx: float = 0,
+        vy: float = 0,
+        available_jumps: int | None = None,
+        direction=Direction.RIGHT,
+    ) -> int:
+        """add a body and return its index"""
+        if self._count == len(self._pos):
+            self._grow()
+        i = self._count
+        self._pos[i] = (x, y)
+        self._vel[i] = (vx, vy)
+        self._available_jumps[i] = (
+            self._max_available_jumps if available_jumps is None else available_jumps
+        )
+        self._directions[i] = direction.value
+        self._count += 1
+        self._derive_states(slice(i, i + 1))
+        return i
+
+    def remove(self, i: int) -> int:
+        """
+        remove body i, the last body takes its index
+        return the previous index of the moved body
+        """
+        last = self._count - 1
+        for array in self._arrays():
+            array[i] = array[last]
+        self._count -= 1
+        return last
+
+    def jump(self, i: int):
+        if self._available_jumps[i] <= 0:
+            return
+        self._available_jumps[i] -= 1
+        self._vel[i, 1] = self._jump_vy
+
+    def hit_ground(self, mask: np.ndarray):
+        """mask: bodies touching the ground (boolean array or indices)"""
+        self.available_jumps[mask] = self._max_available_jumps
+        self.velocities[mask, 1] = 0
+
+    def hit_roof(self, mask: np.ndarray):
+        self.velocities[mask, 1] = 0
+
+    def step(self, dt: float):
+        """
+        move bodies during dt milliseconds then apply gravity, with the exact
+        displacement of PlayerBody.get_displacement (no drift with tick rate)
+        """
+        t = dt / 1000
+        pos, vel = self.positions, self.velocities
+        pos += vel * t
+        pos[:, 1] += self._weight * t * t / 2
+        vel[:, 1] += self._weight * t
+        self._derive_states(slice(0, self._count))
+
+    def get_rect(self, i: int, size: Tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect(np.floor(self._pos[i]).astype(int).tolist(), size)
+
+    def sync_rects(self, sprites: List[pygame.sprite.Sprite]):
+        """
+        copy positions to sprites rects (sprite i is body i), floored as PlayerBody
+        rects are
+        """
+        positions = np.floor(self.positions[: len(sprites)]).astype(int).tolist()
+        for sprite, pos in zip(sprites, positions):
+            sprite.rect.topleft = pos
+
+    def _derive_states(self, s: slice):
+        # same rules as PlayerSprite.state and PlayerSprite direction
+        vx, vy = self._vel[s, 0], self._vel[s, 1]
+        self._states[s] = np.where(
+            vy != 0,
+            PlayerState.JUMP.value,
+            np.where(vx == 0, PlayerState.IDLE.value, PlayerState.RUN.value),
+        )
+        directions = self._directions[s]
+        directions[vx > 0] = Direction.RIGHT.value
+        directions[vx < 0] = Direction.LEFT.value
+
+    def _arrays(self):
+        return (
+            self._pos,
+            self._vel,
+            self._available_jumps,
+            self._states,
+            self._directions,
+        )
+
+    def _grow(self):
+        capacity = max(1, 2 * len(self._pos))
+        self._pos, self._vel, self._available_jumps, self._states, self._directions = (
+            np.resize(array, (capacity, *array.shape[1:])) for array in self._arrays()
+        )
@@ -0,0 +1,98 @@
+import collections
+import json
+import math
+import pathlib
+import time
+from typing import Dict, Sequence
+
+import pygame
+
+from src.settings import FRAME_TIMES_SIZE
+
+OVERLAY_KEY = pygame.K_F3  # show or hide the profiling overlay
+OVERLAY_FONT_SIZE = 24
+OVERLAY_REFRESH_PERIOD = 500  # ms between overlay text updates
+PHASES = ("inputs", "update", "render", "frame")
+
+
+def percentile(ordered: Sequence[float], p: float) -> float:
+    """nearest rank percentile of sorted values (0 when there is no value)"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p * len(ordered) / 100) - 1)]
+
+
+class FrameTimes:
+    """ring buffer of the last frames durations by phase (in milliseconds)"""
+
+    def __init__(self, size=FRAME_TIMES_SIZE):
+        self._times = {phase: collections.deque(maxlen=size) for phase in PHASES}
+
+    def __len__(self) -> int:
+        return len(self._times["frame"])
+
+    def record(self, inputs: float, update: float, render: float):
+        self._times["inputs"].append(inputs)
+        self._times["update"].append(update)
+        self._times["render"].append(render)
+        self._times["frame"].append(inputs + update + render)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """p50, p95, p99 and worst durations of each phase"""
+        stats = {}
+        for phase, times in self._times.items():
+            ordered = sorted(times)
+            stats[phase] = {
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "worst": ordered[-1] if ordered else 0.0,
+            }
+        return stats
+
+    def export(self, filename: str | pathlib.Path):
+        """append stats as a JSON line to filename"""
+        line = {"time": time.time(), "frames": len(self), "stats": self.get_stats()}
+        with open(filename, "a") as f:
+            f.write(json.dumps(line) + "\n")
+
+
+class ProfilingOverlay:
+    """draw frame time stats on top of the screen"""
+
+    def __init__(self, frame_times: FrameTimes, font_size=OVERLAY_FONT_SIZE):
+        self._frame_times = frame_times
+        self._font = pygame.font.Font(None, font_size)
+        self._surface: pygame.Surface | None = None
+        self._refresh_time = 0  # ms since last text update
+        self.visible = False
+
+    def toggle(self, *args, **kwargs):
+        self.visible = not self.visible
+        self._surface = None
+
+    def draw(self, screen: pygame.Surface, dt: int):
+        """draw overlay at screen top left and update this screen region"""
+        self._refresh_time += dt
+        if self._surface is None or self._refresh_time >= OVERLAY_REFRESH_PERIOD:
+            # text rendering is too slow to be done on each frame
+            self._surface = self._render()
+            self._refresh_time = 0
+        screen.blit(self._surface, (0, 0))
+        pygame.display.update(self._surface.get_rect())
+
+    def _render(self) -> pygame.Surface:
+        lines = [
+            f"{phase:<6s} p50 {s['p50']:5.2f}  p95 {s['p95']:5.2f}  "
+            f"p99 {s['p99']:5.2f}  worst {s['worst']:5.2f} ms"
+            for phase, s in self._frame_times.get_stats().items()
+        ]
+        images = [self._font.render(line, True, (255, 255, 0)) for line in lines]
+        surface = pygame.Surface(
+            (max(i.get_width() for i in images), sum(i.get_height() for i in images))
+        )
+        y = 0
+        for image in images:
+            surface.blit(image, (0, y))
+            y += image.get_height()
+        return surface
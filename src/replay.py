@@ -0,0 +1,101 @@
+import json
+import pathlib
+from typing import Any, Dict, Iterator, List, NamedTuple, TextIO
+
+import pygame
+
+# recording file format (JSON lines):
+#   first line: Game settings the recording was made with (see RECORDED_SETTINGS)
+#   then one line per frame: {"dt": ..., "scene_switch": ..., "events": [...]}
+#   events are {"type": ..., <event attribute>: ...} (only numbers, strings and
+#   tuples of them are kept, eg. window attribute is dropped)
+RECORDED_SETTINGS = ("fixed_timestep", "tick_rate", "max_update_steps")
+
+
+class RecordedFrame(NamedTuple):
+    dt: int  # in milliseconds
+    scene_switch: bool  # whether queued scene was switched to at frame start
+    events: List[pygame.event.Event]
+
+
+def _is_serializable(value: Any) -> bool:
+    if isinstance(value, (tuple, list)):
+        return all(_is_serializable(v) for v in value)
+    return isinstance(value, (bool, int, float, str))
+
+
+def dump_event(event: pygame.event.Event) -> Dict[str, Any]:
+    data = {k: v for k, v in event.dict.items() if _is_serializable(v)}
+    data["type"] = event.type
+    return data
+
+
+def parse_event(data: Dict[str, Any]) -> pygame.event.Event:
+    attributes = {
+        k: tuple(v) if isinstance(v, list) else v
+        for k, v in data.items()
+        if k != "type"
+    }
+    return pygame.event.Event(data["type"], attributes)
+
+
+class EventRecorder:
+    """record events returned by pygame.event.get and frames dt to a file"""
+
+    def __init__(self, file: TextIO, settings: Dict[str, Any]):
+        self._file = file
+        self._events: List[pygame.event.Event] = []
+        self._file.write(json.dumps(settings) + "\n")
+
+    def get_events(self) -> List[pygame.event.Event]:
+        events = pygame.event.get()
+        self._events.extend(events)
+        return events
+
+    def end_frame(self, dt: int, scene_switch: bool):
+        frame = {
+            "dt": dt,
+            "scene_switch": scene_switch,
+            "events": [dump_event(e) for e in self._events],
+        }
+        self._file.write(json.dumps(frame) + "\n")
+        self._events = []
+
+
+class EventPlayer:
+    """feed recorded events back, frame by frame"""
+
+    def __init__(self, frames: List[RecordedFrame]):
+        self._frames = frames
+        self._events: List[pygame.event.Event] = []
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        """iterate frames, get_events returns the events of the current frame"""
+        for frame in self._frames:
+            self._events = list(frame.events)
+            yield frame
+        self._events = []
+
+    def get_events(self) -> List[pygame.event.Event]:
+        events, self._events = self._events, []
+        return events
+
+
+def load_recording(
+    filename: str | pathlib.Path,
+) -> tuple[Dict[str, Any], List[RecordedFrame]]:
+    """Load recorded Game settings and frames"""
+    with open(filename, "r") as f:
+        settings = json.loads(f.readline())
+        frames = [
+            RecordedFrame(
+                frame["dt"],
+                frame["scene_switch"],
+                [parse_event(e) for e in frame["events"]],
+            )
+            for frame in map(json.loads, f)
+        ]
+    return settings, frames
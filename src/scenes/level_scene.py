@@ -1,7 +1,144 @@
+import math
+import pathlib
+from typing import List, Tuple
 
+import pygame
 
-from src.core import Scene
+from src.collision import CollisionWorld, get_solid_rects
+from src.core import InputHandler, Renderer, Scene, Updater
+from src.graphics import Camera, PlayerAnimationHandler, PlayerSprite
+from src.settings import (
+    FIRST_LEVEL,
+    MAX_EVENTS_PER_FRAME,
+    RENDER_SIZE,
+    UI_SCALE,
+)
+from src.tilemap import ChunkedLayerRenderer, TileMap, load_tile_map
+
+
+class LevelInputHandler(InputHandler):
+    def __init__(self, player: PlayerSprite):
+        super().__init__(max_events_per_frame=MAX_EVENTS_PER_FRAME)
+        self._player = player
+        self._key_down_callbacks = {
+            pygame.K_LEFT: self._move_left,
+            pygame.K_RIGHT: self._move_right,
+            pygame.K_UP: self._jump,
+            pygame.K_SPACE: self._jump,
+        }
+        self._key_up_callbacks = {
+            pygame.K_LEFT: self._stop_horizontal_movement,
+            pygame.K_RIGHT: self._stop_horizontal_movement,
+        }
+
+    def get_key_down_callbacks(self) -> dict:
+        return self._key_down_callbacks
+
+    def get_key_up_callbacks(self) -> dict:
+        return self._key_up_callbacks
+
+    def _move_left(self, *args, **kwargs):
+        self._player.move_left()
+
+    def _move_right(self, *args, **kwargs):
+        self._player.move_right()
+
+    def _jump(self, *args, **kwargs):
+        self._player.jump()
+
+    def _stop_horizontal_movement(self, *args, **kwargs):
+        self._player.stop_horizontal_movement()
+
+
+class LevelUpdater(Updater):
+    def __init__(self, player: PlayerSprite, world: CollisionWorld):
+        self._player = player
+        self._world = world
+        self._previous_pos = self._get_player_pos()
+
+    def update(self, dt: int):
+        player = self._player
+        self._previous_pos = self._get_player_pos()
+        dx, dy = player.get_displacement(dt)
+        player.apply_gravity(dt)
+        player.sub_pixel = self._world.move_sprite(player, dx, dy, player.sub_pixel)
+        player.update_image(dt)
+
+    def get_player_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """player rect interpolated between the last two simulation steps"""
+        (x0, y0), (x1, y1) = self._previous_pos, self._get_player_pos()
+        return pygame.Rect(
+            math.floor(x0 + (x1 - x0) * alpha),
+            math.floor(y0 + (y1 - y0) * alpha),
+            *self._player.rect.size,
+        )
+
+    def _get_player_pos(self) -> Tuple[float, float]:
+        rect, (rx, ry) = self._player.rect, self._player.sub_pixel
+        return rect.x + rx, rect.y + ry
+
+
+class LevelRenderer(Renderer):
+    def __init__(
+        self,
+        tile_map: TileMap,
+        player: PlayerSprite,
+        world: CollisionWorld,
+        updater: LevelUpdater,
+    ):
+        super().__init__()
+        # the world is scaled as the UI is: players see as much of it at any
+        # render resolution
+        self._layers = [
+            ChunkedLayerRenderer(tile_map, layer, scale=UI_SCALE)
+            for layer in tile_map.layers
+        ]
+        self._player = player
+        self._world = world
+        self._updater = updater
+        self._camera = Camera(
+            RENDER_SIZE, bounds=tile_map.rect, target=player, scale=UI_SCALE
+        )
+
+    def render(self, screen: pygame.surface.Surface, alpha: float = 1.0):
+        # player is drawn (and followed) between its last two simulated positions
+        player_rect = self._updater.get_player_rect(alpha)
+        self._camera.update(player_rect.center)
+        screen.fill((0, 0, 0))
+        for layer in self._layers:
+            # only chunks overlapping the camera view are drawn
+            layer.draw(screen, self._camera.view)
+        sprites = self._world.query_sprites(self._camera.view)
+        self._camera.draw(screen, sprites, {self._player: player_rect})
+        pygame.display.update()
+
+
+def get_level_images(level: str = FIRST_LEVEL) -> List[pathlib.Path]:
+    """images LevelScene loads (preloaded before switching to it)"""
+    tileset = load_tile_map(level).tileset
+    return [tileset, *PlayerAnimationHandler.get_images("player")]
 
 
 class LevelScene(Scene):
-    pass
+    def __init__(self, level: str = FIRST_LEVEL):
+        super().__init__()
+        self._tile_map = load_tile_map(level)
+        self._world = CollisionWorld(get_solid_rects(self._tile_map))
+        self._player = PlayerSprite()
+        # player falls from the top of the level on its left side
+        self._player.rect.midtop = (3 * self._tile_map.tile_size, 0)
+        self._world.add_sprite(self._player)
+        self._input_handler = LevelInputHandler(self._player)
+        self._updater = LevelUpdater(self._player, self._world)
+        self._renderer = LevelRenderer(
+            self._tile_map, self._player, self._world, self._updater
+        )
+
+    def handle_inputs(self):
+        self._input_handler.handle_inputs()
+
+    def update(self, dt: int):
+        self._updater.update(dt)
+
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        self._renderer.render(screen, alpha)
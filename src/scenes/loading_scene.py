@@ -0,0 +1,146 @@
+import logging
+import pathlib
+import queue
+import threading
+from typing import Callable, Iterable, Tuple
+
+import pygame
+
+from src.core import DirtyRectRenderer, InputHandler, Scene
+from src.graphics import preload_font, preload_images
+from src.settings import DIRTY_RECT_RENDERING, LOADING_SCREEN, RENDER_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class SceneLoader:
+    """
+    build a scene once its assets are read and decoded on a background thread
+    the scene itself is built on main thread (pixel format conversion requires it)
+    """
+
+    def __init__(
+        self,
+        scene_queue: queue.Queue,
+        scene_factory: Callable[[], Scene],
+        images: Iterable[str | pathlib.Path] = (),
+        fonts: Iterable[Tuple[str | pathlib.Path, int]] = (),
+    ):
+        self._scene_queue = scene_queue
+        self._scene_factory = scene_factory
+        self._images = tuple(images)
+        self._fonts = tuple(fonts)
+        self._loaded_count = 0
+        self._error: Exception | None = None
+        self._done = False
+        self._thread = threading.Thread(target=self._preload, daemon=True)
+
+    @property
+    def progress(self) -> float:
+        """preloaded assets ratio in [0, 1]"""
+        total = len(self._images) + len(self._fonts)
+        return self._loaded_count / total if total else 1.0
+
+    @property
+    def ready(self) -> bool:
+        return not self._thread.is_alive() and self._thread.ident is not None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def start(self):
+        self._thread.start()
+
+    def wait(self):
+        """block until assets are preloaded then build the scene"""
+        self._thread.join()
+        self.poll()
+
+    def poll(self):
+        """build the scene and push it to scene queue once assets are preloaded"""
+        if self._done or not self.ready:
+            return
+        if self._error is not None:
+            raise self._error
+        self._done = True
+        self._scene_queue.put(self._scene_factory())
+
+    def _preload(self):
+        try:
+            preload_images(self._images, self._on_preloaded)
+            for filename, size in self._fonts:
+                preload_font(filename, size)
+                self._loaded_count += 1
+        except Exception as e:
+            logger.exception("Failed to preload scene assets")
+            self._error = e
+
+    def _on_preloaded(self):
+        self._loaded_count += 1
+
+
+class LoadingRenderer(DirtyRectRenderer):
+    def __init__(self, loader: SceneLoader):
+        super().__init__(dirty_rects=DIRTY_RECT_RENDERING)
+        self._loader = loader
+        self._progress = loader.progress  # last rendered progress
+        self._bar_rect = pygame.rect.Rect(
+            0, 0, RENDER_SIZE[0] // 2, RENDER_SIZE[1] // 40
+        )
+        self._bar_rect.center = (RENDER_SIZE[0] // 2, RENDER_SIZE[1] // 2)
+
+    def check_dirty(self):
+        if self._progress != self._loader.progress:
+            self._progress = self._loader.progress
+            self.mark_dirty(self._bar_rect)
+
+    def draw(self, screen: pygame.surface.Surface):
+        width = RENDER_SIZE[0] // 400
+        progress_rect = self._bar_rect.copy()
+        progress_rect.width = int(self._bar_rect.width * self._progress)
+        pygame.draw.rect(surface=screen, color=(255, 255, 255), rect=progress_rect)
+        pygame.draw.rect(
+            surface=screen, color=(255, 255, 255), rect=self._bar_rect, width=width
+        )
+
+
+class LoadingScene(Scene):
+    """
+    wait for a SceneLoader to finish (keep the game responsive meanwhile)
+    if show_progress is False, the previous frame stays on screen
+    """
+
+    def __init__(self, loader: SceneLoader, show_progress=LOADING_SCREEN):
+        self._loader = loader
+        self._input_handler = InputHandler()
+        self._renderer = LoadingRenderer(loader) if show_progress else None
+
+    def handle_inputs(self):
+        self._input_handler.handle_inputs()
+
+    def update(self, dt: int):
+        self._loader.poll()
+
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        if self._renderer is not None:
+            self._renderer.render(screen, alpha)
+
+    def invalidate(self):
+        if self._renderer is not None:
+            self._renderer.invalidate()
+
+    def wait(self):
+        self._loader.wait()
+
+
+def load_scene(
+    scene_queue: queue.Queue,
+    scene_factory: Callable[[], Scene],
+    images: Iterable[str | pathlib.Path] = (),
+    fonts: Iterable[Tuple[str | pathlib.Path, int]] = (),
+):
+    """switch to a loading scene while next scene assets are preloaded"""
+    loader = SceneLoader(scene_queue, scene_factory, images, fonts)
+    loader.start()
+    scene_queue.put(LoadingScene(loader))
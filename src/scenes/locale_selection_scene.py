@@ -3,14 +3,29 @@ from typing import List
 
 import pygame
 
-from src.core import InputHandler, Renderer, Scene, SelectionViewModel
+from src.core import DirtyRectRenderer, InputHandler, Scene, SelectionViewModel
 from src.graphics import Sprite, load_image
-from src.scenes.menu_scene import MenuScene
-from src.settings import WINDOW_SIZE, init_i18n
+from src.scenes.loading_scene import load_scene
+from src.scenes.menu_scene import MENU_FONTS, MenuScene
+from src.settings import (
+    DIRTY_RECT_RENDERING,
+    MAX_EVENTS_PER_FRAME,
+    RENDER_SIZE,
+    UI_SCALE,
+)
+from src.translations import get_catalog, set_locale
+
+
+def _scale_image(image: pygame.Surface) -> pygame.Surface:
+    """scale image designed for 1080p to render resolution"""
+    if UI_SCALE == 1:
+        return image
+    return pygame.transform.smoothscale_by(image, UI_SCALE)
 
 
 class LocaleSelectionInputHandler(InputHandler):
     def __init__(self, model: SelectionViewModel, scene_queue: queue.Queue):
+        super().__init__(max_events_per_frame=MAX_EVENTS_PER_FRAME)
         self._model = model
         self._scene_queue = scene_queue
         self._key_down_callbacks = {
@@ -30,49 +45,70 @@ class LocaleSelectionInputHandler(InputHandler):
         self._model.increment_cursor_pos()
 
     def _select_locale(self, *args, **kwargs):
-        init_i18n(self._model.selected)
+        set_locale(self._model.selected)
         # update game scene to menu scene
-        self._scene_queue.put(MenuScene(scene_queue=self._scene_queue))
+        load_scene(
+            self._scene_queue,
+            lambda: MenuScene(scene_queue=self._scene_queue),
+            fonts=MENU_FONTS,
+        )
+        return True
 
 
-class LocaleSelectionRenderer(Renderer):
+class LocaleSelectionRenderer(DirtyRectRenderer):
     def __init__(self, model: SelectionViewModel):
+        super().__init__(dirty_rects=DIRTY_RECT_RENDERING)
         self._model = model
+        self._cursor_pos = model.cursor_pos  # last rendered cursor position
+        # updated in place to avoid allocating a rect on each draw
+        self._cursor_rect = pygame.rect.Rect(0, 0, 0, 0)
         self._flags = pygame.sprite.Group(
             [
-                Sprite(load_image(f"flag_{locale}.png"))
+                Sprite(_scale_image(load_image(f"flag_{locale}.png")))
                 for locale in self._model.collection
             ]
         )
         # set flag position
         for i, fs in enumerate(self._flags):
             v_offset = (
-                WINDOW_SIZE[0] - len(self._model.collection) * fs.rect.width
+                RENDER_SIZE[0] - len(self._model.collection) * fs.rect.width
             ) / (len(self._model.collection) + 1)
             fs.rect.left = v_offset * (i + 1) + fs.rect.width * i
-            fs.rect.top = (WINDOW_SIZE[1] - fs.rect.height) / 2
+            fs.rect.top = (RENDER_SIZE[1] - fs.rect.height) / 2
+
+    def check_dirty(self):
+        if self._cursor_pos != self._model.cursor_pos:
+            # erase previous cursor and draw new one
+            self.mark_dirty(self._get_selection_cursor_rect(self._cursor_pos))
+            self._cursor_pos = self._model.cursor_pos
+            self.mark_dirty(self._get_selection_cursor_rect(self._cursor_pos))
 
-    def render(self, screen: pygame.surface.Surface):
-        screen.fill((0, 0, 0))
+    def draw(self, screen: pygame.surface.Surface):
         self._flags.draw(surface=screen)
         self._draw_selection_cursor(screen=screen)
-        pygame.display.update()
 
     def _draw_selection_cursor(self, screen: pygame.surface.Surface):
-        fs = self._flags.sprites()[self._model.cursor_pos]
-        width = WINDOW_SIZE[0] // 400
-        offset = WINDOW_SIZE[0] // 150
-        rect = pygame.rect.Rect(
+        width = RENDER_SIZE[0] // 400
+        rect = self._get_selection_cursor_rect(self._model.cursor_pos)
+        pygame.draw.rect(surface=screen, color=(255, 0, 0), rect=rect, width=width)
+
+    def _get_selection_cursor_rect(self, cursor_pos: int) -> pygame.rect.Rect:
+        """cursor rect around item at cursor_pos (shared rect, copy it to keep it)"""
+        fs = self._flags.sprites()[cursor_pos]
+        offset = RENDER_SIZE[0] // 150
+        self._cursor_rect.update(
             fs.rect.left - offset,
             fs.rect.top - offset,
             fs.rect.width + 2 * offset,
             fs.rect.height + 2 * offset,
         )
-        pygame.draw.rect(surface=screen, color=(255, 0, 0), rect=rect, width=width)
+        return self._cursor_rect
 
 
 class LocaleSelectionScene(Scene):
     def __init__(self, locales: List[str], scene_queue: queue.Queue):
+        # texts of all locales are loaded now, selecting a locale is instant
+        get_catalog()
         self._model = SelectionViewModel(collection=locales)
         self._input_handler = LocaleSelectionInputHandler(
             model=self._model, scene_queue=scene_queue
@@ -82,5 +118,8 @@ class LocaleSelectionScene(Scene):
     def handle_inputs(self):
         self._input_handler.handle_inputs()
 
-    def render(self, screen: pygame.Surface):
-        self._renderer.render(screen=screen)
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        self._renderer.render(screen=screen, alpha=alpha)
+
+    def invalidate(self):
+        self._renderer.invalidate()
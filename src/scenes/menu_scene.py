@@ -1,17 +1,30 @@
 import queue
 
-import i18n
 import pygame
 
-from src.core import InputHandler, Renderer, Scene, SelectionViewModel
+from src.core import DirtyRectRenderer, InputHandler, Scene, SelectionViewModel
 from src.graphics import FontSprite
-from src.scenes.level_scene import LevelScene
-from src.settings import BLANKA_FONT, GAME_NAME, WINDOW_SIZE
+from src.scenes.level_scene import LevelScene, get_level_images
+from src.scenes.loading_scene import load_scene
+from src.settings import (
+    BLANKA_FONT,
+    DIRTY_RECT_RENDERING,
+    GAME_NAME,
+    MAX_EVENTS_PER_FRAME,
+    RENDER_SIZE,
+    UI_SCALE,
+)
+from src.translations import t
+
+BANNER_FONT_SIZE = round(100 * UI_SCALE)
+MENU_FONT_SIZE = round(50 * UI_SCALE)
+# fonts used by MenuScene (preloaded before switching to it)
+MENU_FONTS = [(BLANKA_FONT, BANNER_FONT_SIZE), (BLANKA_FONT, MENU_FONT_SIZE)]
 
 
 class MenuInputHandler(InputHandler):
     def __init__(self, model: SelectionViewModel, scene_queue: queue.Queue):
-        super().__init__()
+        super().__init__(max_events_per_frame=MAX_EVENTS_PER_FRAME)
         self._model = model
         self._scene_queue = scene_queue
         self._key_down_callbacks = {
@@ -24,56 +37,75 @@ class MenuInputHandler(InputHandler):
 
     def _select_menu(self, *args, **kwargs):
         # update game scene to level scene
-        self._scene_queue.put(LevelScene())
+        load_scene(self._scene_queue, LevelScene, images=get_level_images())
+        return True
 
 
-class MenuRenderer(Renderer):
+class MenuRenderer(DirtyRectRenderer):
     def __init__(self, model: SelectionViewModel):
-        super().__init__()
+        super().__init__(dirty_rects=DIRTY_RECT_RENDERING)
         self._model = model
+        self._cursor_pos = model.cursor_pos  # last rendered cursor position
+        # updated in place to avoid allocating a rect on each draw
+        self._cursor_rect = pygame.rect.Rect(0, 0, 0, 0)
         self._banner_sprite = FontSprite(
-            GAME_NAME, BLANKA_FONT, 100, pygame.Color(255, 0, 0)
+            GAME_NAME, BLANKA_FONT, BANNER_FONT_SIZE, pygame.Color(255, 0, 0)
         )
-        self._banner_sprite.rect.top = WINDOW_SIZE[1] // 8
-        self._banner_sprite.rect.centerx = WINDOW_SIZE[0] // 2
+        self._banner_sprite.rect.top = RENDER_SIZE[1] // 8
+        self._banner_sprite.rect.centerx = RENDER_SIZE[0] // 2
         self._menus_sprite = pygame.sprite.Group(
             [
-                FontSprite(menu_name, BLANKA_FONT, 50, pygame.Color(255, 255, 255))
+                FontSprite(
+                    menu_name, BLANKA_FONT, MENU_FONT_SIZE, pygame.Color(255, 255, 255)
+                )
                 for menu_name in self._model.collection
             ]
         )
         for menu_sprite in self._menus_sprite:
-            menu_sprite.rect.center = (WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2)
+            menu_sprite.rect.center = (RENDER_SIZE[0] // 2, RENDER_SIZE[1] // 2)
+
+    def check_dirty(self):
+        if self._cursor_pos != self._model.cursor_pos:
+            # erase previous cursor and draw new one
+            self.mark_dirty(self._get_selection_cursor_rect(self._cursor_pos))
+            self._cursor_pos = self._model.cursor_pos
+            self.mark_dirty(self._get_selection_cursor_rect(self._cursor_pos))
 
-    def render(self, screen: pygame.surface.Surface):
-        screen.fill((0, 0, 0))
+    def draw(self, screen: pygame.surface.Surface):
         screen.blit(self._banner_sprite.image, self._banner_sprite.rect)
         self._menus_sprite.draw(screen)
         self._draw_selection_cursor(screen)
-        pygame.display.update()
 
     def _draw_selection_cursor(self, screen: pygame.surface.Surface):
-        fs = self._menus_sprite.sprites()[self._model.cursor_pos]
-        width = WINDOW_SIZE[0] // 400
-        offset = WINDOW_SIZE[0] // 150
-        rect = pygame.rect.Rect(
+        width = RENDER_SIZE[0] // 400
+        rect = self._get_selection_cursor_rect(self._model.cursor_pos)
+        pygame.draw.rect(surface=screen, color=(255, 0, 0), rect=rect, width=width)
+
+    def _get_selection_cursor_rect(self, cursor_pos: int) -> pygame.rect.Rect:
+        """cursor rect around item at cursor_pos (shared rect, copy it to keep it)"""
+        fs = self._menus_sprite.sprites()[cursor_pos]
+        offset = RENDER_SIZE[0] // 150
+        self._cursor_rect.update(
             fs.rect.left - offset,
             fs.rect.top - offset,
             fs.rect.width + 2 * offset,
             fs.rect.height + 2 * offset,
         )
-        pygame.draw.rect(surface=screen, color=(255, 0, 0), rect=rect, width=width)
+        return self._cursor_rect
 
 
 class MenuScene(Scene):
     def __init__(self, scene_queue: queue.Queue):
         super().__init__()
-        self._model = SelectionViewModel(collection=[i18n.t("new_game")])
+        self._model = SelectionViewModel(collection=[t("new_game")])
         self._input_handler = MenuInputHandler(self._model, scene_queue)
         self._renderer = MenuRenderer(self._model)
 
     def handle_inputs(self):
         self._input_handler.handle_inputs()
 
-    def render(self, screen: pygame.Surface):
-        self._renderer.render(screen)
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        self._renderer.render(screen, alpha)
+
+    def invalidate(self):
+        self._renderer.invalidate()
@@ -1,33 +1,77 @@
+import logging
 import pathlib
 
-import i18n
-
 GAME_NAME = "2372"
 
 # display
 WINDOW_SIZE = (1920, 1080)
+# internal resolution scenes are drawn at, when smaller than WINDOW_SIZE frames are
+# upscaled to the window by SDL (pygame.SCALED), eg. (960, 540) or (480, 270)
+RENDER_SIZE = WINDOW_SIZE
+UI_SCALE = RENDER_SIZE[1] / 1080  # UI (fonts, images) is designed for 1080p
 FPS = 60
+LOADING_SCREEN = True  # show a progress bar while next scene assets are loaded
+DIRTY_RECT_RENDERING = True  # only redraw screen regions which changed
+
+# inputs
+MAX_EVENTS_PER_FRAME = None  # max input events dispatched per frame (None: no limit)
+
+# simulation
+FIXED_TIMESTEP = True  # run updates with a fixed dt decoupled from FPS
+TICK_RATE = 120  # simulation steps per second
+MAX_UPDATE_STEPS = 8  # max simulation steps per frame (spiral of death guard)
+
+# assets
+ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024  # memory budget of loaded assets
+TEXT_CACHE_SIZE = 512  # max number of rendered text surfaces kept in memory
+SCALED_IMAGE_CACHE_SIZE = 256  # sprite images scaled to RENDER_SIZE kept in memory
+# load animation frames from texture atlases (see scripts/build_atlas.py)
+USE_TEXTURE_ATLAS = True
+# derive left facing animation frames from right facing ones
+MIRROR_ANIMATIONS = True
+# convert images without (or with binary) transparency to faster to blit formats
+OPTIMIZE_IMAGE_FORMATS = True
+# images decoding workers (None: one per core), threads unless IMAGE_DECODE_PROCESSES
+IMAGE_DECODE_WORKERS = None
+IMAGE_DECODE_PROCESSES = False  # processes only pay off for many large images
+# read assets from ASSETS_BUNDLE when it exists (loose files are read otherwise)
+USE_ASSETS_BUNDLE = True
+
+# levels
+FIRST_LEVEL = "level1.map"  # built with scripts/build_level.py
+TILE_CHUNK_SIZE = 8  # tiles are pre-rendered by chunks of 8x8 tiles
+TILE_CHUNK_EVICT_DISTANCE = 2  # in chunks from the view
+COLLISION_CELL_SIZE = 128  # spatial hash cells size in pixels
+
+# logs
+ASYNC_LOGGING = True  # format and write logs on a background thread
+LOG_LEVEL = logging.DEBUG
+# log level per subsystem (logger name), eg. {"src.graphics": logging.WARNING}
+LOG_LEVELS = {}
+
+# telemetry
+FRAME_TIMES_SIZE = 600  # last frames kept for frame time statistics
+# append stats to FRAME_TIMES_FILE (file I/O in the frame loop, enable it to profile)
+EXPORT_FRAME_TIMES = False
+FRAME_TIMES_EXPORT_PERIOD = 10_000  # ms between stats exports
 
 # i18n
 LOCALES = ["fr", "en"]
 
 # directories
 ROOT_DIR = pathlib.Path(__file__).parent.parent
-FONTS_DIR = ROOT_DIR / "assets" / "fonts"
-I18N_DIR = ROOT_DIR / "assets" / "i18n"
-IMAGES_DIR = ROOT_DIR / "assets" / "images"
-SOUNDS_DIR = ROOT_DIR / "assets" / "sounds"
+ASSETS_DIR = ROOT_DIR / "assets"
+FONTS_DIR = ASSETS_DIR / "fonts"
+I18N_DIR = ASSETS_DIR / "i18n"
+IMAGES_DIR = ASSETS_DIR / "images"
+ATLASES_DIR = IMAGES_DIR / "atlases"
+LEVELS_DIR = ASSETS_DIR / "levels"
+SOUNDS_DIR = ASSETS_DIR / "sounds"
 
 # files
+ASSETS_BUNDLE = ROOT_DIR / "assets.bundle"  # built with scripts/build_bundle.py
+I18N_CATALOG = ROOT_DIR / "i18n.catalog.json"  # built by scripts/build_i18n_catalog.py
 LOGS_FILE = ROOT_DIR / "logs.log"
+FRAME_TIMES_FILE = ROOT_DIR / "frame_times.jsonl"  # rolling frame time stats
 BLANKA_FONT = pathlib.Path("blanka", "Blanka.otf")
 CLICK_SOUND = "click.wav"
-
-
-def init_i18n(locale: str):
-    """sets internationalization settings"""
-    i18n.set("available_locales", LOCALES)
-    # to load files 'fr.json', 'en.json'
-    i18n.set("filename_format", "{locale}.{format}")
-    i18n.set("locale", locale)
-    i18n.load_path.append(I18N_DIR)
@@ -0,0 +1,248 @@
+import array
+import logging
+import math
+import pathlib
+import struct
+import sys
+import zlib
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.bundle import read_asset
+from src.graphics import load_image, optimize_surface
+from src.settings import LEVELS_DIR, TILE_CHUNK_EVICT_DISTANCE, TILE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# tile map file format (little endian):
+#   header: magic b"TMAP", version (u8), width (u16), height (u16), tile size (u16)
+#   tileset: path length (u8), tileset image path relative to images directory (utf-8)
+#   layers: layer count (u8) then for each layer
+#       name length (u8), name (utf-8), flags (u8),
+#       compressed size (u32), zlib compressed tile ids (u16, row by row)
+# tile id 0 is an empty tile, tile id n is the n-th tile of the tileset (left to right)
+TILE_MAP_MAGIC = b"TMAP"
+TILE_MAP_VERSION = 1
+_HEADER = struct.Struct("<4sBHHH")
+
+
+class TileLayer:
+    SOLID = 1  # flag of layers whose tiles collide with sprites
+
+    def __init__(self, name: str, tiles: array.array, flags=0):
+        self.name = name
+        self.tiles = tiles  # tile ids, row by row
+        self.flags = flags
+
+    @property
+    def solid(self) -> bool:
+        return bool(self.flags & self.SOLID)
+
+
+class TileMap:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        tile_size: int,
+        tileset: str | pathlib.Path,
+        layers: List[TileLayer],
+    ):
+        self.width = width  # in tiles
+        self.height = height  # in tiles
+        self.tile_size = tile_size  # in pixels
+        self.tileset = pathlib.Path(tileset)
+        self.layers = layers
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """tile map bounds in pixels"""
+        return pygame.Rect(
+            0, 0, self.width * self.tile_size, self.height * self.tile_size
+        )
+
+    def get_tile(self, layer: TileLayer, x: int, y: int) -> int:
+        """tile id at tile position (0 outside of tile map)"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return layer.tiles[y * self.width + x]
+        return 0
+
+    def get_layer(self, name: str) -> TileLayer:
+        return next(layer for layer in self.layers if layer.name == name)
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack("<B", len(data)) + data
+
+
+def _unpack_str(data: bytes | memoryview, offset: int) -> Tuple[str, int]:
+    length = data[offset]
+    value = bytes(data[offset + 1 : offset + 1 + length]).decode("utf-8")
+    return value, offset + 1 + length
+
+
+def dump_tile_map(tile_map: TileMap) -> bytes:
+    """serialize tile map to tile map file format"""
+    data = bytearray(
+        _HEADER.pack(
+            TILE_MAP_MAGIC,
+            TILE_MAP_VERSION,
+            tile_map.width,
+            tile_map.height,
+            tile_map.tile_size,
+        )
+    )
+    data += _pack_str(tile_map.tileset.as_posix())
+    data += struct.pack("<B", len(tile_map.layers))
+    for layer in tile_map.layers:
+        tiles = array.array("H", layer.tiles)
+        if sys.byteorder != "little":
+            tiles.byteswap()
+        compressed = zlib.compress(tiles.tobytes(), 9)
+        data += _pack_str(layer.name)
+        data += struct.pack("<BI", layer.flags, len(compressed))
+        data += compressed
+    return bytes(data)
+
+
+def parse_tile_map(data: bytes | memoryview) -> TileMap:
+    """deserialize tile map from tile map file format"""
+    magic, version, width, height, tile_size = _HEADER.unpack_from(data)
+    if magic != TILE_MAP_MAGIC or version != TILE_MAP_VERSION:
+        raise ValueError(f"unsupported tile map (magic {magic}, version {version})")
+    tileset, offset = _unpack_str(data, _HEADER.size)
+    layer_count = data[offset]
+    offset += 1
+    layers = []
+    for _ in range(layer_count):
+        name, offset = _unpack_str(data, offset)
+        flags, size = struct.unpack_from("<BI", data, offset)
+        offset += struct.calcsize("<BI")
+        tiles = array.array("H", zlib.decompress(data[offset : offset + size]))
+        if sys.byteorder != "little":
+            tiles.byteswap()
+        if len(tiles) != width * height:
+            raise ValueError(f"layer '{name}' has {len(tiles)} tiles")
+        layers.append(TileLayer(name, tiles, flags))
+        offset += size
+    return TileMap(width, height, tile_size, tileset, layers)
+
+
+def load_tile_map(filename: str | pathlib.Path) -> TileMap:
+    """Load a tile map from filesystem"""
+    fullpath = LEVELS_DIR / filename
+    logger.info("Load tile map '%s'", fullpath)
+    return parse_tile_map(read_asset(fullpath))
+
+
+def load_tileset(filename: str | pathlib.Path, tile_size: int) -> List[pygame.Surface]:
+    """Load tileset image and split it in tiles (subsurfaces, left to right)"""
+    image = load_image(filename)
+    return [
+        image.subsurface(pygame.Rect(x, y, tile_size, tile_size))
+        for y in range(0, image.get_height() - tile_size + 1, tile_size)
+        for x in range(0, image.get_width() - tile_size + 1, tile_size)
+    ]
+
+
+class ChunkedLayerRenderer:
+    """
+    draw a static tile layer from pre-rendered chunks of chunk_size x chunk_size tiles
+    chunks are rendered when they get visible and evicted when they are more than
+    evict_distance chunks away from the view
+    chunks are pre-scaled by scale (see Camera)
+    """
+
+    def __init__(
+        self,
+        tile_map: TileMap,
+        layer: TileLayer,
+        chunk_size=TILE_CHUNK_SIZE,
+        evict_distance=TILE_CHUNK_EVICT_DISTANCE,
+        scale: float = 1.0,
+    ):
+        self._tile_map = tile_map
+        self._layer = layer
+        self._tiles = load_tileset(tile_map.tileset, tile_map.tile_size)
+        self._chunk_size = chunk_size
+        self._chunk_pixels = chunk_size * tile_map.tile_size
+        self._scale = scale
+        # adjacent chunks overlap by up to a pixel rather than leaving gaps
+        self._scaled_chunk_pixels = math.ceil(self._chunk_pixels * scale)
+        self._evict_distance = evict_distance
+        # rendered chunks (None for chunks without tiles)
+        self._chunks: Dict[Tuple[int, int], pygame.Surface | None] = {}
+
+    @property
+    def chunk_count(self) -> int:
+        """number of rendered chunks kept in memory"""
+        return len(self._chunks)
+
+    def get_visible_chunks(self, view: pygame.Rect) -> Tuple[range, range]:
+        """chunk coordinates ranges overlapping view (in pixels)"""
+        cp = self._chunk_pixels
+        max_cx = (self._tile_map.width - 1) // self._chunk_size
+        max_cy = (self._tile_map.height - 1) // self._chunk_size
+        return (
+            range(max(0, view.left // cp), min(max_cx, (view.right - 1) // cp) + 1),
+            range(max(0, view.top // cp), min(max_cy, (view.bottom - 1) // cp) + 1),
+        )
+
+    def draw(self, screen: pygame.Surface, view: pygame.Rect):
+        """draw chunks overlapping view (in pixels), view top left is drawn at (0, 0)"""
+        cp = self._chunk_pixels
+        cxs, cys = self.get_visible_chunks(view)
+        # same rounding as Camera.to_screen
+        s = self._scale
+        left, top = math.floor(view.left * s), math.floor(view.top * s)
+        blits = []
+        for cy in cys:
+            for cx in cxs:
+                chunk = self._get_chunk(cx, cy)
+                if chunk is not None:
+                    x, y = math.floor(cx * cp * s), math.floor(cy * cp * s)
+                    blits.append((chunk, (x - left, y - top)))
+        screen.blits(blits, doreturn=False)
+        self._evict(cxs, cys)
+
+    def _get_chunk(self, cx: int, cy: int) -> pygame.Surface | None:
+        if (cx, cy) not in self._chunks:
+            self._chunks[(cx, cy)] = self._render_chunk(cx, cy)
+        return self._chunks[(cx, cy)]
+
+    def _render_chunk(self, cx: int, cy: int) -> pygame.Surface | None:
+        ts = self._tile_map.tile_size
+        blits = []
+        for ty in range(cy * self._chunk_size, (cy + 1) * self._chunk_size):
+            for tx in range(cx * self._chunk_size, (cx + 1) * self._chunk_size):
+                tile = self._tile_map.get_tile(self._layer, tx, ty)
+                if tile:
+                    pos = (
+                        (tx - cx * self._chunk_size) * ts,
+                        (ty - cy * self._chunk_size) * ts,
+                    )
+                    blits.append((self._tiles[tile - 1], pos))
+        if not blits:
+            return None
+        # new SRCALPHA surfaces are transparent
+        size = (self._chunk_pixels, self._chunk_pixels)
+        chunk = pygame.Surface(size, pygame.SRCALPHA)
+        chunk.blits(blits, doreturn=False)
+        if self._scale != 1:
+            scaled_size = (self._scaled_chunk_pixels, self._scaled_chunk_pixels)
+            chunk = pygame.transform.scale(chunk, scaled_size)
+        # chunks without partial transparency are blitted without blending
+        return optimize_surface(chunk)
+
+    def _evict(self, cxs: range, cys: range):
+        d = self._evict_distance
+        far_chunks = [
+            (cx, cy)
+            for cx, cy in self._chunks.keys()
+            if not (cxs.start - d <= cx < cxs.stop + d)
+            or not (cys.start - d <= cy < cys.stop + d)
+        ]
+        for key in far_chunks:
+            del self._chunks[key]
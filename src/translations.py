@@ -0,0 +1,126 @@
+import functools
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Mapping
+
+from src.bundle import read_asset
+from src.settings import I18N_CATALOG, I18N_DIR, LOCALES
+
+logger = logging.getLogger(__name__)
+
+# compiled catalog file format (JSON):
+#   {"version": ..., "keys": [key, ...], "locales": {locale: [text, ...], ...}}
+#   a key id is the key index in "keys", locale texts are in key id order
+CATALOG_VERSION = 1
+
+
+def compile_catalog(
+    translations: Mapping[str, Mapping[str, str]],
+    used_keys: Iterable[str] | None = None,
+) -> Dict[str, Any]:
+    """
+    compile {locale: {key: text}} translations to catalog format
+    raise ValueError when locales do not define the same keys (or the keys used in
+    source files when used_keys is set)
+    """
+    keys = sorted({key for texts in translations.values() for key in texts})
+    errors = [
+        f"missing key '{key}' in locale '{locale}'"
+        for locale, texts in translations.items()
+        for key in keys
+        if key not in texts
+    ]
+    if used_keys is not None:
+        used_keys = set(used_keys)
+        errors.extend(
+            f"key '{key}' is not used in source files"
+            for key in keys
+            if key not in used_keys
+        )
+        errors.extend(
+            f"key '{key}' is used in source files but not defined"
+            for key in sorted(used_keys.difference(keys))
+        )
+    if errors:
+        raise ValueError(", ".join(errors))
+    return {
+        "version": CATALOG_VERSION,
+        "keys": keys,
+        "locales": {
+            locale: [texts[key] for key in keys]
+            for locale, texts in translations.items()
+        },
+    }
+
+
+def load_translations(locales: Iterable[str] = LOCALES) -> Dict[str, Dict[str, str]]:
+    """Load {locale: {key: text}} translations from locale JSON files"""
+    translations = {}
+    for locale in locales:
+        data = json.loads(bytes(read_asset(I18N_DIR / f"{locale}.json")))
+        translations[locale] = data[locale]
+    return translations
+
+
+class Catalog:
+    """texts of all locales, switching locale or looking a text up costs nothing"""
+
+    def __init__(self, compiled: Mapping[str, Any]):
+        if compiled["version"] != CATALOG_VERSION:
+            raise ValueError(f"unsupported catalog (version {compiled['version']})")
+        self._key_ids = {key: i for i, key in enumerate(compiled["keys"])}
+        self._locales: Dict[str, List[str]] = dict(compiled["locales"])
+        self._locale: str | None = None
+        self._texts: List[str] = []
+
+    @property
+    def locale(self) -> str | None:
+        return self._locale
+
+    def set_locale(self, locale: str):
+        self._texts = self._locales[locale]
+        self._locale = locale
+
+    def key_id(self, key: str) -> int:
+        return self._key_ids[key]
+
+    def t(self, key: int | str) -> str:
+        """text of key (or key id, see key_id) in current locale"""
+        if isinstance(key, str):
+            key = self._key_ids[key]
+        return self._texts[key]
+
+
+def _is_catalog_stale() -> bool:
+    """whether a locale JSON file was edited after I18N_CATALOG was built"""
+    mtime = I18N_CATALOG.stat().st_mtime
+    return any(f.stat().st_mtime > mtime for f in I18N_DIR.glob("*.json"))
+
+
+@functools.cache
+def get_catalog() -> Catalog:
+    """
+    Load I18N_CATALOG once (compiled from locale JSON files when not built or
+    older than them, used keys are then only checked by scripts/build_i18n_catalog.py)
+    """
+    if I18N_CATALOG.exists() and not _is_catalog_stale():
+        logger.info("Load i18n catalog '%s'", I18N_CATALOG)
+        compiled = json.loads(I18N_CATALOG.read_bytes())
+    else:
+        if I18N_CATALOG.exists():
+            logger.warning("'%s' is older than locale files, rebuild it", I18N_CATALOG)
+        logger.info("Compile i18n catalog from '%s'", I18N_DIR)
+        compiled = compile_catalog(load_translations())
+    return Catalog(compiled)
+
+
+def set_locale(locale: str):
+    get_catalog().set_locale(locale)
+
+
+def get_locale() -> str | None:
+    return get_catalog().locale
+
+
+def t(key: int | str) -> str:
+    return get_catalog().t(key)
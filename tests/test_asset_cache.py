@@ -0,0 +1,56 @@
+from src.graphics import AssetCache
+
+
+def load(asset):
+    return lambda: asset
+
+
+def test_get__when_missing__loads_asset():
+    tested = AssetCache(max_bytes=100)
+
+    assert tested.get("a", load("asset a"), len) == "asset a"
+    assert tested.stats["misses"] == 1
+    assert tested.stats["bytes"] == len("asset a")
+
+
+def test_get__when_cached__does_not_load_asset():
+    tested = AssetCache(max_bytes=100)
+    tested.get("a", load("asset a"), len)
+
+    assert tested.get("a", load("other asset"), len) == "asset a"
+    assert tested.stats["hits"] == 1
+
+
+def test_get__when_over_budget__evicts_least_recently_used_assets():
+    tested = AssetCache(max_bytes=10)
+    tested.get("a", load("aaaa"), len)
+    tested.get("b", load("bbbb"), len)
+    tested.get("a", load("aaaa"), len)  # "b" is now the least recently used
+
+    tested.get("c", load("cccc"), len)
+
+    assert tested.stats["evictions"] == 1
+    assert tested.stats["bytes"] == 8
+    assert tested.get("a", load("new a"), len) == "aaaa", "'a' is still cached"
+    assert tested.get("b", load("new b"), len) == "new b", "'b' was evicted"
+
+
+def test_get__when_asset_is_bigger_than_budget__keeps_it():
+    tested = AssetCache(max_bytes=2)
+    tested.get("a", load("a"), len)
+
+    assert tested.get("b", load("bbbb"), len) == "bbbb"
+    assert tested.stats["entries"] == 1
+    assert tested.stats["evictions"] == 1
+
+
+def test_get__shared_blocks__are_counted_once_until_last_asset_is_evicted():
+    tested = AssetCache(max_bytes=10)
+    tested.get("a", load("a"), lambda _: {"atlas": 6})
+    tested.get("b", load("b"), lambda _: {"atlas": 6, "b": 2})
+    assert tested.stats["bytes"] == 8
+
+    tested.get("c", load("c"), lambda _: {"c": 4})
+
+    assert tested.stats["evictions"] == 2, "evicting 'a' alone frees nothing"
+    assert tested.stats["bytes"] == 4
@@ -0,0 +1,103 @@
+import io
+import os
+import pathlib
+
+import pygame
+import pytest
+
+from src.bundle import (
+    AssetBundle,
+    BufferReader,
+    _get_edited_assets,
+    dump_bundle,
+    read_asset,
+)
+from src.settings import IMAGES_DIR
+
+
+@pytest.fixture
+def bundle_file(tmp_path):
+    fname = tmp_path / "assets.bundle"
+    with open(fname, "wb") as f:
+        dump_bundle(
+            [
+                ("i18n/en.json", b'{"en": {}}'),
+                ("images/flag_en.png", (IMAGES_DIR / "flag_en.png").read_bytes()),
+            ],
+            f,
+        )
+    return fname
+
+
+def test_asset_bundle__reads_dumped_assets(bundle_file):
+    tested = AssetBundle(bundle_file)
+
+    assert len(tested) == 2
+    assert "i18n/en.json" in tested
+    assert "i18n/fr.json" not in tested
+    assert bytes(tested.read("i18n/en.json")) == b'{"en": {}}'
+    assert tested.size("i18n/en.json") == len(b'{"en": {}}')
+
+
+def test_asset_bundle__when_not_a_bundle__raises(tmp_path):
+    fname = tmp_path / "assets.bundle"
+    fname.write_bytes(b"TMAP" + bytes(16))
+
+    with pytest.raises(ValueError):
+        AssetBundle(fname)
+
+
+def test_asset_bundle__open__can_be_loaded_by_pygame(bundle_file):
+    tested = AssetBundle(bundle_file)
+
+    image = pygame.image.load(tested.open("images/flag_en.png"), "flag_en.png")
+
+    assert image.get_size() == pygame.image.load(IMAGES_DIR / "flag_en.png").get_size()
+
+
+@pytest.fixture
+def bundle(mocker, bundle_file):
+    bundle = AssetBundle(bundle_file)
+    mocker.patch("src.bundle.get_bundle", return_value=bundle)
+    _get_edited_assets.cache_clear()
+    yield bundle
+    _get_edited_assets.cache_clear()
+
+
+@pytest.mark.parametrize("edited,expected", [(False, b'{"en": {}}'), (True, b"{}")])
+def test_read_asset__when_loose_file_is_newer__reads_it(
+    mocker, bundle, tmp_path, edited, expected
+):
+    mocker.patch("src.bundle.ASSETS_DIR", tmp_path)
+    loose_file = tmp_path / "i18n" / "en.json"
+    loose_file.parent.mkdir()
+    loose_file.write_bytes(b"{}")
+    mtime = bundle.mtime + (10 if edited else -10)
+    os.utime(loose_file, (mtime, mtime))
+
+    assert bytes(read_asset(loose_file)) == expected
+    assert bytes(read_asset(tmp_path / "images" / "flag_en.png")), "not loose"
+
+
+def test_read_asset__without_loose_assets__does_not_stat_them(
+    mocker, bundle, tmp_path
+):
+    mocker.patch("src.bundle.ASSETS_DIR", tmp_path / "assets")
+    stat = mocker.spy(pathlib.Path, "stat")
+
+    tested = read_asset(tmp_path / "assets" / "i18n" / "en.json")
+
+    assert bytes(tested) == b'{"en": {}}'
+    assert stat.call_count <= 1, "only assets directory existence is checked"
+
+
+def test_buffer_reader__reads_and_seeks():
+    tested = BufferReader(memoryview(b"0123456789"))
+
+    assert tested.read(3) == b"012"
+    assert tested.seek(-2, io.SEEK_END) == 8
+    assert tested.read() == b"89"
+    assert tested.read(1) == b""
+    assert tested.seek(2, io.SEEK_SET) == 2
+    assert tested.seek(1, io.SEEK_CUR) == 3
+    assert tested.tell() == 3
@@ -0,0 +1,70 @@
+import pygame
+import pytest
+
+from src.graphics import Camera, Sprite
+
+
+@pytest.fixture
+def target() -> Sprite:
+    sprite = Sprite(pygame.Surface((10, 10)))
+    sprite.rect.center = (500, 500)
+    return sprite
+
+
+def test_update__centers_view_on_target(target: Sprite):
+    tested = Camera((200, 100), target=target)
+
+    tested.update()
+
+    assert tested.view.center == (500, 500)
+
+
+def test_update__keeps_view_inside_bounds(target: Sprite):
+    tested = Camera((200, 100), bounds=pygame.Rect(0, 0, 550, 520), target=target)
+
+    tested.update()
+
+    assert tested.view == pygame.Rect(350, 420, 200, 100)
+
+
+def test_to_screen__converts_world_to_screen_coordinates(target: Sprite):
+    tested = Camera((200, 100), target=target)
+    tested.update()
+
+    assert tested.to_screen(target.rect).center == (100, 50)
+
+
+def test_draw__draws_visible_sprites_only(target: Sprite):
+    hidden = Sprite(pygame.Surface((10, 10)))
+    hidden.rect.topleft = (0, 0)
+    tested = Camera((200, 100), target=target)
+    tested.update()
+    screen = pygame.Surface((200, 100))
+
+    assert tested.draw(screen, [target, hidden]) == 1
+
+
+def test_draw__draws_sprites_at_given_rects(target: Sprite):
+    target.image.fill((255, 0, 0))
+    tested = Camera((200, 100), target=target)
+    tested.update()
+    screen = pygame.Surface((200, 100))
+
+    tested.draw(screen, [target], {target: target.rect.move(50, 0)})
+
+    assert screen.get_at((150, 50)) == (255, 0, 0)
+    assert screen.get_at((100, 50)) == (0, 0, 0)
+
+
+def test_draw__when_scaled__view_is_screen_size_divided_by_scale(target: Sprite):
+    target.image.fill((255, 0, 0))
+    tested = Camera((200, 100), target=target, scale=0.5)
+    tested.update()
+    screen = pygame.Surface((200, 100))
+
+    tested.draw(screen, [target])
+
+    assert tested.view.size == (400, 200)
+    assert tested.to_screen(target.rect) == pygame.Rect(97, 47, 5, 5)
+    assert screen.get_at((101, 51)) == (255, 0, 0)
+    assert screen.get_at((102, 51)) == (0, 0, 0)
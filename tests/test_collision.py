@@ -0,0 +1,132 @@
+import array
+
+import pygame
+import pytest
+
+from src.collision import CollisionWorld, SpatialHash, get_solid_rects
+from src.graphics import PlayerSprite
+from src.scenes.level_scene import LevelUpdater
+from src.tilemap import TileLayer, TileMap
+
+
+def test_query__returns_colliding_keys_only():
+    tested = SpatialHash(cell_size=100)
+    tested.insert("a", pygame.Rect(10, 10, 10, 10))
+    tested.insert("b", pygame.Rect(50, 50, 10, 10))
+    tested.insert("c", pygame.Rect(500, 500, 10, 10))
+
+    assert tested.query(pygame.Rect(0, 0, 30, 30)) == ["a"]
+
+
+def test_move__updates_cells_when_crossing_cell_border():
+    tested = SpatialHash(cell_size=100)
+    tested.insert("a", pygame.Rect(10, 10, 10, 10))
+
+    tested.move("a", pygame.Rect(250, 10, 10, 10))
+
+    assert tested.query(pygame.Rect(0, 0, 100, 100)) == []
+    assert tested.query(pygame.Rect(200, 0, 100, 100)) == ["a"]
+
+
+def test_remove__removes_key():
+    tested = SpatialHash(cell_size=100)
+    tested.insert("a", pygame.Rect(10, 10, 150, 10))
+
+    tested.remove("a")
+
+    assert "a" not in tested
+    assert not tested._cells, "empty cells are removed"
+
+
+def test_get_solid_rects__merges_row_tiles():
+    tiles = array.array("H", [1, 1, 0, 1, 0, 0, 0, 0])
+    tile_map = TileMap(4, 2, 10, "tiles.png", [TileLayer("ground", tiles, 1)])
+
+    assert get_solid_rects(tile_map) == [
+        pygame.Rect(0, 0, 20, 10),
+        pygame.Rect(30, 0, 10, 10),
+    ]
+
+
+@pytest.fixture
+def sprite(mocker):
+    sprite = mocker.Mock()
+    sprite.rect = pygame.Rect(0, 0, 10, 10)
+    return sprite
+
+
+def test_move_sprite__when_falling_on_ground__stops_and_calls_hit_ground(sprite):
+    tested = CollisionWorld([pygame.Rect(0, 100, 100, 10)])
+
+    tested.move_sprite(sprite, 0, 500)
+
+    assert sprite.rect.bottom == 100, "sprite does not go through the ground"
+    sprite.hit_ground.assert_called_once()
+
+
+def test_move_sprite__when_jumping_into_roof__stops_and_calls_hit_roof(sprite):
+    tested = CollisionWorld([pygame.Rect(0, -50, 100, 10)])
+
+    tested.move_sprite(sprite, 0, -100)
+
+    assert sprite.rect.top == -40
+    sprite.hit_roof.assert_called_once()
+
+
+def test_move_sprite__when_standing_on_ground__calls_hit_ground(sprite):
+    tested = CollisionWorld([pygame.Rect(0, 10, 100, 10)])
+
+    tested.move_sprite(sprite, 0, 0.2)
+
+    assert sprite.rect.bottom == 10
+    sprite.hit_ground.assert_called_once()
+
+
+def test_move_sprite__when_hitting_wall__stops_horizontally(sprite):
+    tested = CollisionWorld([pygame.Rect(30, -100, 10, 200)])
+
+    tested.move_sprite(sprite, 100, 0)
+
+    assert sprite.rect.right == 30
+    sprite.hit_ground.assert_not_called()
+
+
+def test_move_sprite__updates_sprite_position_in_spatial_hash(sprite):
+    tested = CollisionWorld([], cell_size=100)
+    tested.add_sprite(sprite)
+
+    tested.move_sprite(sprite, 300, 0)
+
+    assert tested.query_sprites(pygame.Rect(300, 0, 10, 10)) == [sprite]
+
+
+def simulate_jump(tick_rate: int) -> tuple:
+    """jump height and horizontal distance after one second of running jump"""
+    world = CollisionWorld([pygame.Rect(-1000, 1000, 3000, 10)])
+    player = PlayerSprite()
+    player.rect = pygame.Rect(0, 968, 32, 32)
+    tested = LevelUpdater(player, world)
+    dt = 1000 / tick_rate
+    tested.update(dt)  # lands on ground
+    player.move_right()
+    player.jump()
+    top = player.rect.top
+    for _ in range(tick_rate):
+        tested.update(dt)
+        top = min(top, player.rect.top)
+    return 968 - top, player.rect.x
+
+
+def test_level_updater__jump_does_not_depend_on_tick_rate(mocker):
+    mocker.patch("src.graphics.PlayerAnimationHandler.__init__", return_value=None)
+    mocker.patch("src.graphics.PlayerAnimationHandler.image", return_value=None)
+    mocker.patch("src.graphics.PlayerAnimationHandler.update", return_value=False)
+
+    height_60, distance_60 = simulate_jump(60)
+    height_240, distance_240 = simulate_jump(240)
+
+    # jump_vy ** 2 / (2 * weight) pixels high, max_vx_speed pixels per second
+    assert height_60 == pytest.approx(83.3, abs=1)
+    assert height_240 == pytest.approx(height_60, abs=1)
+    assert distance_60 == pytest.approx(500, abs=1)
+    assert distance_240 == pytest.approx(distance_60, abs=1)
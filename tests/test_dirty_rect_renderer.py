@@ -0,0 +1,68 @@
+import pygame
+import pytest
+
+from src.core import DirtyRectRenderer
+
+
+class DummyRenderer(DirtyRectRenderer):
+    def __init__(self, dirty_rects=True):
+        super().__init__(dirty_rects=dirty_rects)
+        self.draw_count = 0
+
+    def draw(self, screen: pygame.surface.Surface):
+        self.draw_count += 1
+
+
+@pytest.fixture
+def screen() -> pygame.Surface:
+    return pygame.Surface((100, 100))
+
+
+@pytest.fixture
+def display_update_mock(mocker):
+    return mocker.patch("pygame.display.update")
+
+
+def test_render__first_frame__updates_whole_screen(screen, display_update_mock):
+    tested = DummyRenderer()
+
+    tested.render(screen)
+
+    display_update_mock.assert_called_once_with([screen.get_rect()])
+
+
+def test_render__when_nothing_is_dirty__does_not_draw(screen, display_update_mock):
+    tested = DummyRenderer()
+    tested.render(screen)
+    display_update_mock.reset_mock()
+
+    tested.render(screen)
+
+    assert tested.draw_count == 1, "only the first frame is drawn"
+    display_update_mock.assert_not_called()
+
+
+def test_render__updates_only_dirty_rects(screen, display_update_mock):
+    tested = DummyRenderer()
+    tested.render(screen)
+    display_update_mock.reset_mock()
+
+    tested.mark_dirty(pygame.Rect(10, 10, 5, 5))
+    tested.mark_dirty(pygame.Rect(90, 90, 20, 20))
+    tested.render(screen)
+
+    display_update_mock.assert_called_once_with(
+        [pygame.Rect(10, 10, 5, 5), pygame.Rect(90, 90, 10, 10)]
+    )
+
+
+def test_render__when_dirty_rects_disabled__updates_whole_screen(
+    screen, display_update_mock
+):
+    tested = DummyRenderer(dirty_rects=False)
+    tested.render(screen)
+    display_update_mock.reset_mock()
+
+    tested.render(screen)
+
+    display_update_mock.assert_called_once_with([screen.get_rect()])
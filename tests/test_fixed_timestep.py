@@ -0,0 +1,29 @@
+import pytest
+
+from src.core import FixedTimestep
+
+
+@pytest.mark.parametrize(
+    "dt,expected_steps",
+    [(0, 0), (7, 0), (10, 1), (20, 2), (25, 2)],
+)
+def test_advance__returns_number_of_whole_steps(dt: int, expected_steps: int):
+    tested = FixedTimestep(tick_rate=100, max_steps=10)
+
+    assert tested.advance(dt) == expected_steps
+
+
+def test_advance__accumulates_remaining_time():
+    tested = FixedTimestep(tick_rate=100, max_steps=10)
+
+    assert tested.advance(6) == 0
+    assert tested.advance(6) == 1, "remaining time is kept between frames"
+    assert tested.alpha == pytest.approx(0.2)
+
+
+def test_advance__caps_steps_and_drops_late_time():
+    tested = FixedTimestep(tick_rate=100, max_steps=3)
+
+    assert tested.advance(1005) == 3, "steps are capped"
+    assert tested.alpha == pytest.approx(0.5), "only the partial step is kept"
+    assert tested.advance(0) == 0, "dropped steps are not caught up later"
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from src.profiling import FrameTimes, percentile
+
+
+@pytest.mark.parametrize(
+    "p,expected",
+    [(50, 5), (95, 10), (99, 10), (10, 1), (0, 1)],
+)
+def test_percentile__returns_nearest_rank(p: float, expected: float):
+    assert percentile(list(range(1, 11)), p) == expected
+
+
+def test_percentile__when_no_value__returns_zero():
+    assert percentile([], 50) == 0.0
+
+
+def test_record__keeps_last_frames_only():
+    tested = FrameTimes(size=3)
+
+    for i in range(5):
+        tested.record(inputs=i, update=0, render=0)
+
+    assert len(tested) == 3
+    assert tested.get_stats()["inputs"]["p50"] == 3, "frames 2, 3 and 4 are kept"
+
+
+def test_get_stats__computes_phases_and_frame_durations():
+    tested = FrameTimes()
+    for i in range(1, 101):
+        tested.record(inputs=1, update=2, render=i)
+
+    stats = tested.get_stats()
+
+    assert stats["inputs"] == {"p50": 1, "p95": 1, "p99": 1, "worst": 1}
+    assert stats["render"] == {"p50": 50, "p95": 95, "p99": 99, "worst": 100}
+    assert stats["frame"]["worst"] == 103
+
+
+def test_export__appends_json_lines(tmp_path):
+    filename = tmp_path / "frame_times.jsonl"
+    tested = FrameTimes()
+    tested.record(inputs=1, update=2, render=3)
+
+    tested.export(filename)
+    tested.export(filename)
+
+    lines = [json.loads(line) for line in filename.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["frames"] == 1
+    assert lines[0]["stats"]["frame"]["p99"] == 6
@@ -0,0 +1,115 @@
+import os
+import random
+
+import pygame
+import pytest
+
+from src.core import InputHandler
+from src.game import Game
+from src.graphics import asset_cache
+from src.replay import EventRecorder
+from src.scenes.level_scene import LevelScene
+from src.scenes.loading_scene import LoadingScene
+
+RENDER_SIZE = (960, 540)
+WINDOW_SIZE = (1920, 1080)
+
+FRAMES = 300
+# frame index => keys pressed at that frame (select locale, new game, then move)
+SCRIPT = {
+    10: [pygame.K_RIGHT],
+    20: [pygame.K_RETURN],
+    30: [pygame.K_RETURN],
+    60: [pygame.K_RIGHT],
+    120: [pygame.K_UP],
+    180: [pygame.K_LEFT],
+    240: [pygame.K_UP],
+}
+
+
+class PositionsGame(Game):
+    """record player positions after each frame of the level"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.positions = []
+
+    def _run_frame(self, dt: int, scene_switch: bool | None = None) -> bool:
+        scene_switch = super()._run_frame(dt, scene_switch)
+        if isinstance(self._scene, LevelScene):
+            player = self._scene._player
+            self.positions.append((player.rect.topleft, player.sub_pixel))
+        return scene_switch
+
+
+@pytest.fixture
+def display(mocker, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    mocker.patch("src.game.init_logging")
+    # Game registers its global callbacks
+    for name in ("global_key_down_callbacks", "global_event_callbacks"):
+        monkeypatch.setattr(InputHandler, name, dict(getattr(InputHandler, name)))
+    yield
+    InputHandler.event_source = None
+    asset_cache.clear()
+    pygame.quit()
+
+
+def record(game: Game, filename: os.PathLike):
+    """play SCRIPT with variable frame times as Game.run(record=...) does"""
+    dts = random.Random(0)
+    with open(filename, "w") as f:
+        recorder = EventRecorder(f, game._settings)
+        InputHandler.event_source = recorder.get_events
+        for i in range(FRAMES):
+            for key in SCRIPT.get(i, []):
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+            if isinstance(game._scene, LoadingScene):
+                # level is reached at the same frame whatever the load time
+                game._scene.wait()
+            dt = dts.randint(10, 25)
+            recorder.end_frame(dt, game._run_frame(dt))
+        InputHandler.event_source = None
+
+
+@pytest.mark.parametrize("fixed_timestep", [True, False])
+def test_replay__player_positions_are_identical(display, tmp_path, fixed_timestep):
+    filename = tmp_path / "recording.jsonl"
+    recorded = PositionsGame(fixed_timestep=fixed_timestep)
+    record(recorded, filename)
+    assert len(recorded.positions) > FRAMES // 2, "level is reached"
+    assert len(set(recorded.positions)) > FRAMES // 4, "player moves"
+
+    tested = PositionsGame(fixed_timestep=fixed_timestep)
+
+    assert tested.replay(filename) == FRAMES
+    assert tested.positions == recorded.positions
+
+
+@pytest.mark.filterwarnings("ignore:no fast renderer")  # dummy video driver
+def test_game__scenes_render_at_render_size_scaled_to_window_size(
+    display, monkeypatch
+):
+    for module in (
+        "src.game",
+        "src.scenes.locale_selection_scene",
+        "src.scenes.menu_scene",
+        "src.scenes.loading_scene",
+        "src.scenes.level_scene",
+    ):
+        monkeypatch.setattr(f"{module}.RENDER_SIZE", RENDER_SIZE)
+    monkeypatch.setattr("src.game.WINDOW_SIZE", WINDOW_SIZE)
+    monkeypatch.setattr("src.scenes.level_scene.UI_SCALE", RENDER_SIZE[1] / 1080)
+    tested = Game()
+    for i in range(40):
+        for key in SCRIPT.get(i, []):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        if isinstance(tested._scene, LoadingScene):
+            tested._scene.wait()
+        tested._run_frame(16)
+
+    assert isinstance(tested._scene, LevelScene)
+    assert tested._scene._renderer._camera.view.size == (1920, 1080), "same world"
+    assert pygame.display.get_surface().get_size() == RENDER_SIZE
+    assert pygame.display.get_window_size() == WINDOW_SIZE
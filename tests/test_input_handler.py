@@ -0,0 +1,133 @@
+import os
+
+import pygame
+import pytest
+
+from src.core import InputHandler
+
+
+class DummyInputHandler(InputHandler):
+    def __init__(self, max_events_per_frame: int | None = None):
+        super().__init__(max_events_per_frame=max_events_per_frame)
+        self.keys = []
+        self._key_down_callbacks = {
+            pygame.K_LEFT: self._on_key,
+            pygame.K_RIGHT: self._on_key,
+            pygame.K_RETURN: self._on_return,
+        }
+
+    def get_key_down_callbacks(self) -> dict:
+        return self._key_down_callbacks
+
+    def _on_key(self, event: pygame.event.Event):
+        self.keys.append(event.key)
+
+    def _on_return(self, event: pygame.event.Event):
+        self.keys.append(event.key)
+        return True
+
+
+def key_down(key: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, {"key": key})
+
+
+def test_handle_inputs__dispatches_every_event(mocker):
+    mock_ret = [key_down(k) for k in [pygame.K_LEFT, pygame.K_UP, pygame.K_RIGHT]]
+    mocker.patch("pygame.event.get", return_value=mock_ret)
+    tested = DummyInputHandler()
+
+    tested.handle_inputs()
+
+    assert tested.keys == [pygame.K_LEFT, pygame.K_RIGHT]
+
+
+def test_handle_inputs__when_callback_returns_true__drops_remaining_events(mocker):
+    mock_ret = [key_down(pygame.K_RETURN), key_down(pygame.K_LEFT)]
+    mocker.patch("pygame.event.get", return_value=mock_ret)
+    tested = DummyInputHandler()
+
+    tested.handle_inputs()
+
+    assert tested.keys == [pygame.K_RETURN]
+
+
+def test_handle_inputs__with_budget__dispatches_remaining_events_next_frame(mocker):
+    mock_get = mocker.patch(
+        "pygame.event.get",
+        return_value=[key_down(pygame.K_LEFT) for _ in range(3)],
+    )
+    tested = DummyInputHandler(max_events_per_frame=2)
+
+    tested.handle_inputs()
+
+    assert len(tested.keys) == 2, "events over budget are not dispatched"
+
+    mock_get.return_value = []
+    tested.handle_inputs()
+
+    assert len(tested.keys) == 3, "remaining events are dispatched next frame"
+
+
+@pytest.mark.parametrize(
+    "key_down_callbacks,expected",
+    [(None, [pygame.QUIT]), ({pygame.K_LEFT: id}, [pygame.QUIT, pygame.KEYDOWN])],
+)
+def test_get_allowed_events__depends_on_callbacks(
+    mocker, key_down_callbacks: dict | None, expected: list
+):
+    tested = InputHandler()
+    mocker.patch.object(
+        tested, "get_key_down_callbacks", return_value=key_down_callbacks
+    )
+
+    assert tested.get_allowed_events() == expected
+
+
+def test_handle_inputs__dispatches_global_key_down_callbacks(mocker):
+    global_keys = []
+    mocker.patch.dict(
+        InputHandler.global_key_down_callbacks,
+        {pygame.K_F3: lambda event: global_keys.append(event.key)},
+    )
+    mock_ret = [key_down(pygame.K_F3), key_down(pygame.K_LEFT)]
+    mocker.patch("pygame.event.get", return_value=mock_ret)
+    tested = DummyInputHandler()
+
+    tested.handle_inputs()
+
+    assert global_keys == [pygame.K_F3]
+    assert tested.keys == [pygame.K_LEFT]
+    assert pygame.KEYDOWN in InputHandler().get_allowed_events()
+
+
+def test_handle_inputs__dispatches_global_event_callbacks(mocker):
+    exposed = []
+    mocker.patch.dict(
+        InputHandler.global_event_callbacks,
+        {pygame.WINDOWEXPOSED: lambda event: exposed.append(event.type)},
+    )
+    mock_ret = [pygame.event.Event(pygame.WINDOWEXPOSED), key_down(pygame.K_LEFT)]
+    mocker.patch("pygame.event.get", return_value=mock_ret)
+    tested = DummyInputHandler()
+
+    tested.handle_inputs()
+
+    assert exposed == [pygame.WINDOWEXPOSED]
+    assert tested.keys == [pygame.K_LEFT]
+
+
+def test_handle_inputs__only_blocks_unused_input_events(mocker, monkeypatch):
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    mocker.patch("pygame.event.get", return_value=[])
+    tested = DummyInputHandler()
+
+    tested.handle_inputs()
+
+    assert not pygame.event.get_blocked(pygame.KEYDOWN)
+    assert pygame.event.get_blocked(pygame.KEYUP), "no key up callback"
+    assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+    for event_type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.ACTIVEEVENT):
+        assert not pygame.event.get_blocked(event_type), "window events are queued"
+    InputHandler._allowed_events_owner = None
+    pygame.display.quit()
@@ -0,0 +1,110 @@
+import os
+import pathlib
+
+import pygame
+import pytest
+
+from src import graphics
+from src.graphics import (
+    Direction,
+    asset_cache,
+    get_animation_images,
+    load_animation_frames,
+    load_atlas,
+    load_image,
+)
+
+
+@pytest.fixture
+def init_pygamedisplay(monkeypatch):
+    # convert_alpha requires a display mode
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    asset_cache.clear()
+    pygame.display.quit()
+
+
+def test_load_existing_atlas__colorkey_frames_are_rle_surfaces(init_pygamedisplay):
+    frames = load_atlas("player")
+
+    assert len(frames) == 16, "atlas contains right facing player frames"
+    for frame in frames.values():
+        assert frame.get_parent() is None, "SDL cannot RLE blit subsurfaces"
+        assert frame.get_flags() & pygame.RLEACCELOK
+
+
+def test_load_existing_atlas__when_not_colorkey__frames_are_subsurfaces(
+    init_pygamedisplay, mocker
+):
+    image = load_image(pathlib.Path("atlases", "player.png")).convert_alpha()
+    mocker.patch("src.graphics.load_image", return_value=image)
+
+    frames = load_atlas("player")
+
+    parents = {frame.get_parent() for frame in frames.values()}
+    assert parents == {image}, "all frames share the atlas surface"
+
+
+def test_load_existing_atlas__frames_match_source_images(init_pygamedisplay):
+    frames = load_atlas("player")
+
+    for name in ["idle/idle-right-1", "run/run-right-8", "jump/jump-right-3"]:
+        expected = load_image(pathlib.Path("player", f"{name}.png"))
+        assert frames[name].get_size() == expected.get_size()
+        assert pygame.image.tobytes(frames[name], "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        ), f"frame '{name}' pixels match source image"
+
+
+def test_load_non_existing_atlas(init_pygamedisplay):
+    with pytest.raises(FileNotFoundError):
+        load_atlas("thisisnotanatlas")
+
+
+def test_load_animation_frames__mirror__derives_left_frames_from_right_frames(
+    init_pygamedisplay,
+):
+    left = load_animation_frames("player", "run", Direction.LEFT, 8, mirror=True)
+    right = load_animation_frames("player", "run", Direction.RIGHT, 8, mirror=True)
+
+    for left_frame, right_frame in zip(left, right):
+        expected = pygame.transform.flip(right_frame, True, False)
+        assert pygame.image.tobytes(left_frame, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+    assert (
+        load_animation_frames("player", "run", Direction.LEFT, 8, mirror=True) is left
+    ), "mirrored frames are cached"
+
+
+def test_load_animation_frames__no_mirror__loads_left_frames_from_files(
+    init_pygamedisplay,
+):
+    left = load_animation_frames("player", "jump", Direction.LEFT, 4, mirror=False)
+
+    expected = load_image(pathlib.Path("player", "jump", "jump-left-1.png"))
+    assert left[0] is expected, "frames missing from atlas are loaded from files"
+
+
+def test_load_animation_frames__when_frames_are_in_atlas__loads_no_files(
+    init_pygamedisplay, mocker
+):
+    load_images = mocker.spy(graphics, "load_images")
+
+    right = load_animation_frames("player", "jump", Direction.RIGHT, 4, mirror=False)
+
+    atlas = load_atlas("player")
+    assert right == tuple(atlas[f"jump/jump-right-{i}"] for i in range(1, 5))
+    load_images.assert_not_called()
+
+
+def test_get_animation_images__lists_atlas_and_frames_missing_from_it():
+    right = get_animation_images("player", "jump", Direction.RIGHT, 4, mirror=False)
+    left = get_animation_images("player", "jump", Direction.LEFT, 4, mirror=False)
+
+    assert right == [pathlib.Path("atlases", "player.png")]
+    assert left == [pathlib.Path("atlases", "player.png")] + [
+        pathlib.Path("player", "jump", f"jump-left-{i}.png") for i in range(1, 5)
+    ]
@@ -1,7 +1,7 @@
 import pygame
 import pytest
 
-from src.graphics import load_font
+from src.graphics import asset_cache, load_font
 from src.settings import BLANKA_FONT
 
 
@@ -9,6 +9,7 @@ from src.settings import BLANKA_FONT
 def init_pygamefont():
     pygame.font.init()
     yield
+    asset_cache.clear()
     pygame.font.quit()
 
 
@@ -19,6 +20,13 @@ def test_load_existing_font(init_pygamefont):
     assert isinstance(f, pygame.font.Font), "font is pygame.font.Font"
 
 
+def test_load_existing_font__twice__returns_cached_font(init_pygamefont):
+    f = load_font(BLANKA_FONT, 30)
+
+    assert load_font(BLANKA_FONT, 30) is f, "font is cached"
+    assert load_font(BLANKA_FONT, 31) is not f, "fonts are cached by size"
+
+
 def test_load_non_existing_font(init_pygamefont):
     with pytest.raises(FileNotFoundError):
         load_font("thisisnotafont.otf", 30)
@@ -0,0 +1,122 @@
+import os
+
+import pygame
+import pytest
+
+from src.graphics import (
+    ImageFormat,
+    asset_cache,
+    detect_image_format,
+    image_formats,
+    load_image,
+    load_images,
+    preload_images,
+)
+from src.settings import IMAGES_DIR
+
+
+@pytest.fixture
+def init_pygamedisplay(monkeypatch):
+    # convert and convert_alpha require a display mode
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    asset_cache.clear()
+    image_formats.clear()
+    pygame.display.quit()
+
+
+def surface(*colors) -> pygame.Surface:
+    """one pixel wide surface with a pixel per color"""
+    tested = pygame.Surface((len(colors), 1), pygame.SRCALPHA)
+    for x, color in enumerate(colors):
+        tested.set_at((x, 0), color)
+    return tested
+
+
+@pytest.mark.parametrize(
+    "colors,expected",
+    [
+        ([(1, 2, 3, 255), (4, 5, 6, 255)], (ImageFormat.OPAQUE, None)),
+        ([(1, 2, 3, 255), (4, 5, 6, 0)], (ImageFormat.COLORKEY, (255, 0, 255))),
+        ([(255, 0, 255, 255), (4, 5, 6, 0)], (ImageFormat.COLORKEY, (0, 255, 255))),
+        ([(1, 2, 3, 255), (4, 5, 6, 128)], (ImageFormat.ALPHA, None)),
+    ],
+)
+def test_detect_image_format(colors, expected):
+    assert detect_image_format(surface(*colors)) == expected
+
+
+def test_detect_image_format__without_alpha_channel__is_opaque():
+    assert detect_image_format(pygame.Surface((2, 2))) == (ImageFormat.OPAQUE, None)
+
+
+def test_load_image__when_opaque__has_no_alpha(init_pygamedisplay):
+    tested = load_image("flag_en.png")
+
+    assert not tested.get_flags() & pygame.SRCALPHA
+    assert tested.get_colorkey() is None
+    assert image_formats[IMAGES_DIR / "flag_en.png"] == ImageFormat.OPAQUE
+
+
+def test_load_image__when_binary_transparency__uses_colorkey(init_pygamedisplay):
+    tested = load_image("player/idle/idle-right-1.png")
+    original = pygame.image.load(IMAGES_DIR / "player/idle/idle-right-1.png")
+
+    assert not tested.get_flags() & pygame.SRCALPHA
+    assert tested.get_flags() & pygame.RLEACCELOK, "RLE encoded on first blit"
+    assert tested.get_colorkey() is not None
+    transparent = [
+        (x, y)
+        for x in range(original.get_width())
+        for y in range(original.get_height())
+        if original.get_at((x, y)).a == 0
+    ]
+    assert transparent
+    assert all(tested.get_at(pos) == tested.get_colorkey() for pos in transparent)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_load_images__same_pixels_as_load_image(init_pygamedisplay, processes):
+    filenames = ["flag_en.png", "player/idle/idle-right-1.png"]
+    expected = [pygame.image.load(IMAGES_DIR / filename) for filename in filenames]
+
+    preload_images(filenames, workers=2, processes=processes)
+    tested = [load_image(filename) for filename in filenames]
+
+    for image, original in zip(tested, expected):
+        assert image.get_size() == original.get_size()
+        assert all(
+            image.get_at((x, y)) == original.get_at((x, y))
+            for x in range(original.get_width())
+            for y in range(original.get_height())
+            if original.get_at((x, y)).a == 255
+        )
+    assert image_formats[IMAGES_DIR / "flag_en.png"] == ImageFormat.OPAQUE
+
+
+def test_load_images__keeps_order_and_calls_back(init_pygamedisplay, mocker):
+    on_preloaded = mocker.Mock()
+    filenames = ["flag_fr.png", "flag_en.png"]
+
+    preload_images(filenames, on_preloaded)
+    tested = load_images(filenames)
+
+    assert on_preloaded.call_count == 2
+    assert tested == [load_image(filename) for filename in filenames]
+    flag_fr = pygame.image.load(IMAGES_DIR / "flag_fr.png")
+    assert tested[0].get_size() == flag_fr.get_size()
+
+
+def test_preload_images__when_loaded__calls_back_without_decoding(
+    init_pygamedisplay, mocker
+):
+    load_image("flag_en.png")
+    executor = mocker.patch("concurrent.futures.ThreadPoolExecutor")
+    on_preloaded = mocker.Mock()
+
+    preload_images(["flag_en.png"], on_preloaded, processes=False)
+
+    assert on_preloaded.call_count == 1
+    executor.assert_not_called()
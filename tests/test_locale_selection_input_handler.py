@@ -1,11 +1,11 @@
 import queue
 
-import i18n
 import pygame
 import pytest
 
 from src.core import SelectionViewModel
 from src.scenes.locale_selection_scene import LocaleSelectionInputHandler
+from src.translations import get_locale, set_locale
 
 LOCALES = ["en", "fr", "de"]
 CURSOR_POS_INIT = 1
@@ -60,16 +60,16 @@ def test_on_enter_input_inits_i18n(
     mock_ret = [pygame.event.Event(pygame.KEYDOWN, {"key": key})]
     mocker.patch("pygame.event.get", return_value=mock_ret)
     mocker.patch("src.scenes.locale_selection_scene.MenuScene")
-    i18n.set("locale", "en")
+    set_locale("en")
 
     assert (
-        i18n.get("locale") != LOCALES[tested._model.cursor_pos]
+        get_locale() != LOCALES[tested._model.cursor_pos]
     ), "locale is not set before pressing enter"
 
     tested.handle_inputs()
 
     assert (
-        i18n.get("locale") == LOCALES[tested._model.cursor_pos]
+        get_locale() == LOCALES[tested._model.cursor_pos]
     ), "locale is set after pressing enter"
 
 
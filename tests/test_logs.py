@@ -0,0 +1,68 @@
+import logging
+import threading
+
+import pytest
+
+from src.logs import DeferredQueueHandler, init_logging, stop_logging
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    root = logging.getLogger()
+    level = root.level
+    yield tmp_path / "test.log"
+    stop_logging()
+    root.setLevel(level)
+    logging.getLogger("test.quiet").setLevel(logging.NOTSET)
+
+
+@pytest.mark.parametrize("async_logging", [True, False])
+def test_init_logging__writes_records_to_file(async_logging: bool, log_file):
+    init_logging(log_file, logging.DEBUG, {}, async_logging)
+
+    logging.getLogger("test").info("value is %d", 42)
+    stop_logging()
+
+    assert "INFO     value is 42" in log_file.read_text()
+
+
+def test_init_logging__applies_subsystems_levels(log_file):
+    init_logging(log_file, logging.DEBUG, {"test.quiet": logging.WARNING}, False)
+
+    logging.getLogger("test.quiet").info("hidden")
+    logging.getLogger("test.quiet").warning("shown")
+    logging.getLogger("test.verbose").debug("verbose")
+    stop_logging()
+
+    logs = log_file.read_text()
+    assert "hidden" not in logs
+    assert "shown" in logs
+    assert "verbose" in logs
+
+
+def test_deferred_queue_handler__does_not_format_records(mocker):
+    tested = DeferredQueueHandler(mocker.MagicMock())
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "%s", ("a",), None)
+
+    tested.emit(record)
+
+    assert record.msg == "%s" and record.args == ("a",), "formatted by the listener"
+    tested.queue.put_nowait.assert_called_once_with(record)
+
+
+def test_init_logging__when_async__writes_on_another_thread(mocker, log_file):
+    threads = set()
+    emit = logging.FileHandler.emit
+
+    def record_thread(handler, record):
+        if handler.baseFilename == str(log_file):
+            threads.add(threading.current_thread())
+        emit(handler, record)
+
+    mocker.patch("logging.FileHandler.emit", record_thread)
+    init_logging(log_file, logging.DEBUG, {}, True)
+
+    logging.getLogger("test").info("message")
+    stop_logging()
+
+    assert threads and threading.current_thread() not in threads
@@ -1,3 +1,4 @@
+import pathlib
 import queue
 
 import pygame
@@ -5,6 +6,8 @@ import pytest
 
 from src.core import SelectionViewModel
 from src.scenes.menu_scene import MenuInputHandler
+from src.settings import FIRST_LEVEL
+from src.tilemap import load_tile_map
 
 MENUS = ["menu1"]
 CURSOR_POS_INIT = 0
@@ -31,3 +34,15 @@ def test_on_enter_input_posts_to_scene_queue(
     tested.handle_inputs()
 
     assert not tested._scene_queue.empty(), "scene_queue is not empty"
+
+
+def test_on_enter_input_preloads_level_images(mocker, tested: MenuInputHandler):
+    mock_ret = [pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RETURN})]
+    mocker.patch("pygame.event.get", return_value=mock_ret)
+    load_scene = mocker.patch("src.scenes.menu_scene.load_scene")
+
+    tested.handle_inputs()
+
+    images = load_scene.call_args.kwargs["images"]
+    assert load_tile_map(FIRST_LEVEL).tileset in images, "tileset is preloaded"
+    assert pathlib.Path("atlases", "player.png") in images, "atlas is preloaded"
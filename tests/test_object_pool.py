@@ -0,0 +1,99 @@
+import pygame
+import pytest
+
+from src.core import ObjectPool, RectPool, SpritePool
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.value = None
+
+
+def reset(sprite: PooledSprite, value):
+    sprite.value = value
+
+
+def test_acquire__when_empty__creates_object():
+    tested = ObjectPool(list)
+
+    assert tested.acquire() == []
+    assert tested.stats["created"] == 1
+    assert tested.stats["in_use"] == 1
+
+
+def test_acquire__when_released_objects__reuses_them():
+    tested = ObjectPool(list)
+    obj = tested.acquire()
+    tested.release(obj)
+
+    assert tested.acquire() is obj
+    assert tested.stats == {
+        "created": 1,
+        "reused": 1,
+        "discarded": 0,
+        "in_use": 1,
+        "free": 0,
+    }
+
+
+def test_release__when_pool_is_full__discards_object():
+    tested = ObjectPool(list, max_size=1)
+    first, second = tested.acquire(), tested.acquire()
+
+    tested.release(first)
+    tested.release(second)
+
+    assert len(tested) == 1
+    assert tested.stats["discarded"] == 1
+
+
+def test_release__when_released_twice__raises():
+    tested = ObjectPool(list)
+    obj = tested.acquire()
+    tested.release(obj)
+
+    with pytest.raises(ValueError, match="released twice"):
+        tested.release(obj)
+
+    assert tested.stats["in_use"] == 0
+    assert tested.acquire() is obj
+    assert tested.acquire() is not obj, "obj was pooled once"
+
+
+def test_prefill__allocates_objects_up_front():
+    tested = ObjectPool(list)
+
+    tested.prefill(3)
+    tested.acquire()
+
+    assert len(tested) == 2
+    assert tested.stats["created"] == 3
+    assert tested.stats["reused"] == 1
+
+
+def test_sprite_pool__handles_group_membership():
+    group, other_group = pygame.sprite.Group(), pygame.sprite.Group()
+    tested = SpritePool(PooledSprite, reset)
+
+    sprite = tested.acquire(1, groups=(group,))
+    other_group.add(sprite)
+    assert sprite.value == 1
+    assert sprite in group
+
+    tested.release(sprite)
+    assert not sprite.alive(), "released sprite is removed from every group"
+
+    reused = tested.acquire(2, groups=(other_group,))
+    assert reused is sprite
+    assert reused.value == 2
+    assert reused.groups() == [other_group]
+
+
+def test_rect_pool__acquire__reinitializes_rect():
+    tested = RectPool()
+    rect = tested.acquire(1, 2, 3, 4)
+    tested.release(rect)
+
+    assert tested.acquire((5, 6), (7, 8)) is rect
+    assert rect == pygame.Rect(5, 6, 7, 8)
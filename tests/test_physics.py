@@ -0,0 +1,116 @@
+import numpy as np
+import pygame
+import pytest
+
+from src.collision import CollisionWorld
+from src.graphics import Direction, PlayerBody, PlayerState
+from src.physics import EntityStore
+
+
+def test_step__applies_gravity_and_integrates_positions():
+    tested = EntityStore(weight=1000)
+    tested.add(0, 0, vx=100, vy=0)
+
+    tested.step(dt=100)
+
+    assert tested.velocities[0].tolist() == pytest.approx([100, 100])
+    assert tested.positions[0].tolist() == pytest.approx([10, 5])
+
+
+@pytest.mark.parametrize("tick_rate", [60, 240])
+def test_step__jump_matches_player_body(mocker, tick_rate: int):
+    mocker.patch("src.graphics.PlayerAnimationHandler.__init__", return_value=None)
+    mocker.patch("src.graphics.PlayerAnimationHandler.image")
+    body = PlayerBody(vx=PlayerBody.max_vx_speed, vy=PlayerBody.jump_vy)
+    body.rect = pygame.Rect(0, 0, 32, 32)
+    world = CollisionWorld([])
+    tested = EntityStore(weight=PlayerBody.weight)
+    tested.add(0, 0, vx=PlayerBody.max_vx_speed, vy=PlayerBody.jump_vy)
+    dt = 1000 / tick_rate
+
+    top = 0
+    for _ in range(tick_rate // 2):
+        dx, dy = body.get_displacement(dt)
+        body.apply_gravity(dt)
+        body.sub_pixel = world.move_sprite(body, dx, dy, body.sub_pixel)
+        tested.step(dt)
+        expected = (body.rect.x + body.sub_pixel[0], body.rect.y + body.sub_pixel[1])
+        assert tested.positions[0].tolist() == pytest.approx(expected)
+        top = min(top, tested.positions[0, 1])
+
+    # jump_vy ** 2 / (2 * weight) pixels high
+    assert top == pytest.approx(-250 / 3)
+
+
+def test_step__keeps_sub_pixel_positions():
+    tested = EntityStore(weight=0)
+    tested.add(0, 0, vx=1)
+
+    for _ in range(10):
+        tested.step(dt=100)
+
+    assert tested.positions[0, 0] == pytest.approx(1)
+
+
+@pytest.mark.parametrize(
+    "vx,vy,expected",
+    [
+        (-1, 0, PlayerState.RUN),
+        (0, 0, PlayerState.IDLE),
+        (0, 1, PlayerState.JUMP),
+        (1, -1, PlayerState.JUMP),
+    ],
+)
+def test_states__follow_player_sprite_rules(vx: int, vy: int, expected: PlayerState):
+    tested = EntityStore(weight=0)
+    tested.add(0, 0, vx=vx, vy=vy)
+
+    tested.step(dt=0)
+
+    assert tested.states[0] == expected.value
+
+
+def test_add__grows_arrays():
+    tested = EntityStore(capacity=1)
+
+    for i in range(10):
+        tested.add(i, 0)
+
+    assert len(tested) == 10
+    assert tested.positions[:, 0].tolist() == list(range(10))
+
+
+def test_remove__moves_last_body():
+    tested = EntityStore()
+    for i in range(3):
+        tested.add(i, 0)
+
+    assert tested.remove(0) == 2
+    assert tested.positions[:, 0].tolist() == [2, 1]
+
+
+def test_jump_and_hit_ground__update_available_jumps():
+    tested = EntityStore(jump_vy=-500, max_available_jumps=2)
+    tested.add(0, 0, available_jumps=1)
+
+    tested.jump(0)
+    tested.jump(0)
+
+    assert tested.available_jumps[0] == 0
+    assert tested.velocities[0, 1] == -500
+
+    tested.hit_ground(np.array([True]))
+
+    assert tested.available_jumps[0] == 2
+    assert tested.velocities[0, 1] == 0
+
+
+def test_sync_rects__floors_positions():
+    tested = EntityStore()
+    tested.add(1.6, -0.4, direction=Direction.LEFT)
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(0, 0, 10, 10)
+
+    tested.sync_rects([sprite])
+
+    assert sprite.rect.topleft == (1, -1), "same pixel as PlayerBody rect"
@@ -1,7 +1,9 @@
 import pygame
 import pytest
 
-from src.graphics import Direction, PlayerSprite, PlayerState
+from src.collision import CollisionWorld
+from src.graphics import Direction, PlayerBody, PlayerSprite, PlayerState
+from src.scenes.level_scene import LevelUpdater
 
 
 @pytest.fixture
@@ -294,3 +296,65 @@ def test_state(
     tested = PlayerSprite(vx=vx, vy=vy)
 
     assert tested.state == expected
+
+
+def test_update_horizontal_pos__keeps_sub_pixel_movement(
+        player_animation_handler_mocker
+):
+    tested = PlayerSprite(vx=100)
+    tested.rect = pygame.Rect(50, 50, 32, 32)
+
+    for _ in range(4):
+        tested.update_horizontal_pos(dt=4)  # 0.4 pixel per update
+
+    assert tested.rect.topleft == (51, 50), "1.6 pixels were moved"
+
+
+def test_player_body__has_no_instance_dict(player_animation_handler_mocker):
+    tested = PlayerBody(available_jumps=1)
+
+    assert not hasattr(tested, "__dict__")
+    with pytest.raises(AttributeError):
+        tested.unknown = 0
+
+    tested.jump()
+
+    assert tested.state == PlayerState.JUMP
+
+
+def test_player_sprite__can_be_added_to_groups(player_animation_handler_mocker):
+    group = pygame.sprite.Group()
+
+    tested = PlayerSprite(0, 0, 1, Direction.RIGHT, group)
+
+    assert tested in group
+    assert tested.alive()
+
+
+def test_level_updater__keeps_player_sub_pixel_movement(
+        player_animation_handler_mocker
+):
+    player = PlayerSprite(vx=100)
+    player.rect = pygame.Rect(50, 50, 32, 32)
+    world = CollisionWorld([pygame.Rect(0, 82, 200, 10)])
+    tested = LevelUpdater(player, world)
+
+    for _ in range(4):
+        tested.update(dt=4)  # 0.4 pixel per update
+
+    assert player.rect.topleft == (51, 50), "1.6 pixels were moved"
+    assert player.sub_pixel[0] == pytest.approx(0.6)
+
+
+@pytest.mark.parametrize("alpha,expected", [(0.0, 50), (0.5, 52), (1.0, 54)])
+def test_level_updater__interpolates_player_rect_between_steps(
+        alpha: float, expected: int, player_animation_handler_mocker
+):
+    player = PlayerSprite(vx=250)
+    player.rect = pygame.Rect(50, 50, 32, 32)
+    world = CollisionWorld([pygame.Rect(0, 82, 200, 10)])
+    tested = LevelUpdater(player, world)
+
+    tested.update(dt=16)  # 4 pixels per update
+
+    assert tested.get_player_rect(alpha).topleft == (expected, 50)
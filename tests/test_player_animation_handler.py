@@ -0,0 +1,120 @@
+import os
+import pathlib
+
+import pygame
+import pytest
+
+from src.graphics import (
+    AssetCache,
+    Direction,
+    PlayerAnimationHandler,
+    PlayerState,
+    asset_cache,
+    load_image,
+)
+
+
+@pytest.fixture
+def init_pygamedisplay(monkeypatch):
+    # convert_alpha requires a display mode
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    asset_cache.clear()
+    pygame.display.quit()
+
+
+def test_init__shares_animations_between_instances(mocker, init_pygamedisplay):
+    first = PlayerAnimationHandler()
+    load_mock = mocker.patch("src.graphics.load_animation_frames")
+
+    second = PlayerAnimationHandler(PlayerState.RUN, Direction.LEFT)
+
+    assert first._animations is second._animations, "animations are shared"
+    load_mock.assert_not_called()
+
+
+def test_get_animations__contains_every_state_and_direction(init_pygamedisplay):
+    animations = PlayerAnimationHandler.get_animations("player")
+
+    assert set(animations.keys()) == {
+        (s, d) for s in PlayerState for d in Direction
+    }
+    with pytest.raises(TypeError):
+        animations[(PlayerState.IDLE, Direction.LEFT)] = ()
+
+
+@pytest.mark.parametrize(
+    "state,animation_time,expected_frame",
+    [
+        (PlayerState.IDLE, 0, 0),
+        (PlayerState.IDLE, 150, 1),
+        (PlayerState.RUN, 700, 0),
+        (PlayerState.JUMP, 100, 1),
+    ],
+)
+def test_image__returns_frame_depending_on_animation_time(
+    state: PlayerState,
+    animation_time: int,
+    expected_frame: int,
+    init_pygamedisplay,
+):
+    tested = PlayerAnimationHandler(state, Direction.RIGHT, animation_time)
+
+    frames = tested.get_animations("player")[(state, Direction.RIGHT)]
+    assert tested.image is frames[expected_frame]
+
+
+def test_update__changes_image_at_frame_boundaries(init_pygamedisplay):
+    # idle animation runs at 10 frames per second
+    tested = PlayerAnimationHandler(PlayerState.IDLE, Direction.RIGHT)
+    frames = tested.get_animations("player")[(PlayerState.IDLE, Direction.RIGHT)]
+
+    assert tested.time_to_next_frame == 100
+    assert not tested.update(PlayerState.IDLE, Direction.RIGHT, 60)
+    assert tested.image is frames[0]
+    assert tested.time_to_next_frame == 40
+    assert tested.update(PlayerState.IDLE, Direction.RIGHT, 40)
+    assert tested.image is frames[1]
+    assert tested.time_to_next_frame == 100
+
+
+def test_update__if_state_changes__restarts_animation(init_pygamedisplay):
+    tested = PlayerAnimationHandler(PlayerState.IDLE, Direction.RIGHT, 150)
+
+    assert tested.update(PlayerState.RUN, Direction.LEFT, 10)
+
+    frames = tested.get_animations("player")[(PlayerState.RUN, Direction.LEFT)]
+    assert tested.image is frames[0]
+    assert tested.time_to_next_frame == pytest.approx(1000 / 12)
+
+
+def test_get_animations__frames_are_counted_in_asset_cache_budget(
+    mocker, init_pygamedisplay
+):
+    cache = mocker.patch("src.graphics.asset_cache", AssetCache(max_bytes=1))
+
+    animations = PlayerAnimationHandler.get_animations("player")
+
+    frames = [frame for frames in animations.values() for frame in frames]
+    parents = {frame.get_abs_parent() for frame in frames}
+    assert cache.stats["entries"] == 1, "evicted assets are not referenced anymore"
+    assert cache.stats["bytes"] == sum(
+        p.get_pitch() * p.get_height() for p in parents
+    )
+    assert PlayerAnimationHandler.get_animations("player") is animations
+
+
+def test_get_animations__shared_surfaces_are_counted_once(mocker, init_pygamedisplay):
+    cache = mocker.patch("src.graphics.asset_cache", AssetCache(max_bytes=2**30))
+
+    animations = PlayerAnimationHandler.get_animations("player")
+
+    frames = [frame for frames in animations.values() for frame in frames]
+    parents = {frame.get_abs_parent() for frame in frames}
+    parents.add(load_image(pathlib.Path("atlases", "player.png")))
+    assert cache.stats["entries"] > 1
+    assert cache.stats["bytes"] == sum(
+        p.get_pitch() * p.get_height() for p in parents
+    )
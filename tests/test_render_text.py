@@ -0,0 +1,54 @@
+import pygame
+import pytest
+
+from src.graphics import (
+    FontSprite,
+    _render_text,
+    asset_cache,
+    render_glyphs,
+    render_text,
+)
+from src.settings import BLANKA_FONT
+
+WHITE = pygame.Color(255, 255, 255)
+
+
+@pytest.fixture
+def init_pygamefont():
+    pygame.font.init()
+    yield
+    _render_text.cache_clear()
+    asset_cache.clear()
+    pygame.font.quit()
+
+
+def test_render_text__twice__returns_cached_surface(init_pygamefont):
+    surface = render_text("2372", BLANKA_FONT, 30, WHITE)
+
+    assert render_text("2372", BLANKA_FONT, 30, pygame.Color(WHITE)) is surface
+    assert render_text("2372", BLANKA_FONT, 30, (255, 0, 0)) is not surface
+
+
+def test_render_glyphs__renders_each_character_once(init_pygamefont):
+    render_glyphs("1221", BLANKA_FONT, 30, WHITE)
+
+    assert _render_text.cache_info().misses == 2, "'1' and '2' are rendered once"
+
+
+def test_render_glyphs__composes_cached_characters(init_pygamefont):
+    image = render_glyphs("12", BLANKA_FONT, 30, WHITE)
+
+    one = render_text("1", BLANKA_FONT, 30, WHITE)
+    two = render_text("2", BLANKA_FONT, 30, WHITE)
+    assert image.get_width() == one.get_width() + two.get_width()
+    assert image.get_at((0, 0)) == one.get_at((0, 0))
+
+
+def test_font_sprite__set_text__keeps_position(init_pygamefont):
+    tested = FontSprite("0", BLANKA_FONT, 30, WHITE, glyphs=True)
+    tested.rect.topleft = (10, 20)
+
+    tested.set_text("100")
+
+    assert tested.rect.topleft == (10, 20)
+    assert tested.rect.size == tested.image.get_size()
@@ -0,0 +1,61 @@
+import pygame
+
+from src.replay import (
+    EventPlayer,
+    EventRecorder,
+    RecordedFrame,
+    dump_event,
+    load_recording,
+    parse_event,
+)
+
+
+def key_down(key: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, {"key": key, "window": None})
+
+
+def test_dump_event__keeps_serializable_attributes_only():
+    event = pygame.event.Event(
+        pygame.MOUSEMOTION, {"pos": (1, 2), "window": None, "touch": False}
+    )
+
+    tested = parse_event(dump_event(event))
+
+    assert tested.type == pygame.MOUSEMOTION
+    assert tested.dict == {"pos": (1, 2), "touch": False}
+
+
+def test_event_recorder__records_events_by_frame(mocker, tmp_path):
+    events = [key_down(pygame.K_LEFT)]
+    mocker.patch("pygame.event.get", side_effect=[events, []])
+    filename = tmp_path / "recording.jsonl"
+    with open(filename, "w") as f:
+        tested = EventRecorder(f, {"tick_rate": 120})
+        assert tested.get_events() == events
+        tested.end_frame(16, scene_switch=True)
+        tested.get_events()
+        tested.end_frame(17, scene_switch=False)
+
+    settings, frames = load_recording(filename)
+
+    assert settings == {"tick_rate": 120}
+    assert [(f.dt, f.scene_switch) for f in frames] == [(16, True), (17, False)]
+    assert [e.key for e in frames[0].events] == [pygame.K_LEFT]
+    assert frames[1].events == []
+
+
+def test_event_player__returns_events_of_current_frame_once():
+    frames = [
+        RecordedFrame(16, False, [key_down(pygame.K_LEFT)]),
+        RecordedFrame(16, False, [key_down(pygame.K_UP), key_down(pygame.K_UP)]),
+    ]
+    tested = EventPlayer(frames)
+
+    events = []
+    for _ in tested:
+        events.append([e.key for e in tested.get_events()])
+        assert tested.get_events() == [], "events are consumed"
+
+    assert events == [[pygame.K_LEFT], [pygame.K_UP, pygame.K_UP]]
+    assert len(tested) == 2
+
@@ -0,0 +1,80 @@
+import queue
+
+import pygame
+import pytest
+
+from src.graphics import _preloaded_fonts, asset_cache
+from src.scenes.loading_scene import LoadingScene, SceneLoader, load_scene
+from src.settings import BLANKA_FONT, FONTS_DIR, IMAGES_DIR
+
+
+@pytest.fixture
+def scene_queue() -> queue.Queue:
+    yield queue.Queue()
+    _preloaded_fonts.clear()
+    asset_cache.clear()
+
+
+def test_poll__when_assets_are_preloaded__pushes_scene(mocker, scene_queue):
+    scene = mocker.Mock()
+    tested = SceneLoader(scene_queue, lambda: scene, fonts=[(BLANKA_FONT, 30)])
+
+    tested.start()
+    tested._thread.join()
+    tested.poll()
+
+    assert tested.progress == 1.0
+    assert tested.done
+    assert scene_queue.get_nowait() is scene
+    assert (FONTS_DIR / BLANKA_FONT, 30) in _preloaded_fonts, "font file is read"
+
+
+def test_poll__when_images_are_already_loaded__progress_is_complete(
+    mocker, scene_queue
+):
+    fullpath = IMAGES_DIR / "flag_en.png"
+    asset_cache.get(("image", fullpath), lambda: pygame.Surface((1, 1)), lambda _: 1)
+    tested = SceneLoader(scene_queue, mocker.Mock(), images=["flag_en.png"])
+
+    tested.start()
+    tested.wait()
+
+    assert tested.progress == 1.0
+
+
+def test_poll__when_assets_are_not_preloaded__does_nothing(mocker, scene_queue):
+    factory = mocker.Mock()
+    tested = SceneLoader(scene_queue, factory, fonts=[(BLANKA_FONT, 30)])
+
+    tested.poll()
+
+    assert tested.progress == 0.0
+    factory.assert_not_called()
+    assert scene_queue.empty()
+
+
+def test_poll__when_preload_fails__raises_on_main_thread(mocker, scene_queue):
+    tested = SceneLoader(scene_queue, mocker.Mock(), images=["thisisnotanimage.png"])
+
+    tested.start()
+    tested._thread.join()
+
+    with pytest.raises(FileNotFoundError):
+        tested.poll()
+
+
+def test_load_scene__pushes_loading_scene(mocker, scene_queue):
+    load_scene(scene_queue, mocker.Mock(), fonts=[(BLANKA_FONT, 30)])
+
+    assert isinstance(scene_queue.get_nowait(), LoadingScene)
+
+
+def test_wait__blocks_until_scene_is_queued(mocker, scene_queue):
+    scene = mocker.Mock()
+    tested = SceneLoader(scene_queue, lambda: scene, fonts=[(BLANKA_FONT, 30)])
+
+    tested.start()
+    tested.wait()
+
+    assert tested.done
+    assert scene_queue.get_nowait() is scene
@@ -0,0 +1,117 @@
+import array
+import os
+
+import pygame
+import pytest
+
+from src.graphics import asset_cache
+from src.settings import FIRST_LEVEL
+from src.tilemap import (
+    ChunkedLayerRenderer,
+    TileLayer,
+    TileMap,
+    dump_tile_map,
+    load_tile_map,
+    parse_tile_map,
+)
+
+TILESET = "tiles/tileset.png"
+
+
+@pytest.fixture
+def init_pygamedisplay(monkeypatch):
+    # convert_alpha requires a display mode
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    asset_cache.clear()
+    pygame.display.quit()
+
+
+def make_tile_map(width: int, height: int, tile=1) -> TileMap:
+    tiles = array.array("H", [tile] * width * height)
+    return TileMap(width, height, 32, TILESET, [TileLayer("ground", tiles, 1)])
+
+
+def test_parse_tile_map__reads_dumped_tile_map():
+    tile_map = make_tile_map(5, 3)
+    tile_map.layers[0].tiles[7] = 3
+
+    tested = parse_tile_map(dump_tile_map(tile_map))
+
+    assert (tested.width, tested.height, tested.tile_size) == (5, 3, 32)
+    assert tested.tileset == tile_map.tileset
+    assert tested.get_layer("ground").solid
+    assert tested.get_tile(tested.layers[0], 2, 1) == 3
+    assert tested.get_tile(tested.layers[0], 5, 0) == 0, "outside of tile map"
+
+
+def test_parse_tile_map__when_invalid_magic__raises():
+    with pytest.raises(ValueError):
+        parse_tile_map(b"PNG" + dump_tile_map(make_tile_map(1, 1))[3:])
+
+
+def test_load_tile_map__loads_first_level():
+    tested = load_tile_map(FIRST_LEVEL)
+
+    assert tested.layers, "level has tile layers"
+
+
+def test_draw__renders_only_visible_chunks(init_pygamedisplay):
+    tested = ChunkedLayerRenderer(
+        make_tile_map(64, 64), make_tile_map(64, 64).layers[0], chunk_size=8
+    )
+    screen = pygame.Surface((512, 256))
+
+    tested.draw(screen, pygame.Rect(0, 0, 512, 256))
+
+    assert tested.chunk_count == 2, "chunks of 8x8 tiles (256x256 pixels)"
+    assert screen.get_at((300, 10)) != (0, 0, 0, 255), "tiles are drawn"
+
+
+def test_draw__when_scaled__draws_scaled_chunks(init_pygamedisplay):
+    tile_map = make_tile_map(16, 8)
+    tested = ChunkedLayerRenderer(
+        tile_map, tile_map.layers[0], chunk_size=8, scale=0.5
+    )
+    screen = pygame.Surface((256, 256))
+
+    tested.draw(screen, pygame.Rect(0, 0, 512, 256))
+
+    assert tested._chunks[(1, 0)].get_size() == (128, 128)
+    assert screen.get_at((255, 127)) != (0, 0, 0, 255), "tiles are drawn"
+    assert screen.get_at((255, 128)) == (0, 0, 0, 255), "level is 8 tiles high"
+
+
+@pytest.mark.parametrize(
+    "width,tile,expected_flags",
+    [
+        (8, 1, 0),  # opaque tiles fill the chunk
+        (4, 1, pygame.SRCCOLORKEY),  # empty tiles are fully transparent
+        (8, 4, pygame.SRCALPHA),  # tile with partial transparency
+    ],
+)
+def test_draw__chunks_use_fastest_format(
+    init_pygamedisplay, width, tile, expected_flags
+):
+    tile_map = make_tile_map(width, 8, tile)
+    tested = ChunkedLayerRenderer(tile_map, tile_map.layers[0], chunk_size=8)
+
+    tested.draw(pygame.Surface((256, 256)), pygame.Rect(0, 0, 256, 256))
+
+    flags = tested._chunks[(0, 0)].get_flags()
+    assert flags & (pygame.SRCALPHA | pygame.SRCCOLORKEY) == expected_flags
+
+
+def test_draw__evicts_far_chunks(init_pygamedisplay):
+    tile_map = make_tile_map(256, 8)
+    tested = ChunkedLayerRenderer(
+        tile_map, tile_map.layers[0], chunk_size=8, evict_distance=1
+    )
+    screen = pygame.Surface((256, 256))
+
+    tested.draw(screen, pygame.Rect(0, 0, 256, 256))
+    tested.draw(screen, pygame.Rect(256 * 10, 0, 256, 256))
+
+    assert set(tested._chunks.keys()) == {(10, 0)}
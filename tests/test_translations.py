@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from src.settings import I18N_DIR
+from src.translations import Catalog, compile_catalog, get_catalog, load_translations
+
+TRANSLATIONS = {
+    "en": {"new_game": "New game", "game_over": "Game over"},
+    "fr": {"new_game": "Nouvelle partie", "game_over": "Fin de partie"},
+}
+
+
+@pytest.fixture
+def tested() -> Catalog:
+    return Catalog(compile_catalog(TRANSLATIONS))
+
+
+@pytest.fixture
+def catalog_file(mocker, tmp_path):
+    fname = tmp_path / "i18n.catalog.json"
+    translations = {"en": {"new_game": "Old game"}, "fr": {"new_game": "Ancienne"}}
+    fname.write_text(json.dumps(compile_catalog(translations)))
+    mocker.patch("src.translations.I18N_CATALOG", fname)
+    get_catalog.cache_clear()
+    yield fname
+    get_catalog.cache_clear()
+
+
+def test_compile_catalog__keys_are_sorted():
+    compiled = compile_catalog(TRANSLATIONS)
+
+    assert compiled["keys"] == ["game_over", "new_game"]
+    assert compiled["locales"]["fr"] == ["Fin de partie", "Nouvelle partie"]
+
+
+def test_compile_catalog__when_locale_misses_key__raises():
+    translations = {"en": {"new_game": "New game"}, "fr": {}}
+
+    with pytest.raises(ValueError, match="missing key 'new_game' in locale 'fr'"):
+        compile_catalog(translations)
+
+
+@pytest.mark.parametrize(
+    "used_keys,error",
+    [
+        (["new_game"], "key 'game_over' is not used"),
+        (["new_game", "game_over", "quit"], "key 'quit' is used"),
+    ],
+)
+def test_compile_catalog__when_keys_differ_from_used_keys__raises(used_keys, error):
+    with pytest.raises(ValueError, match=error):
+        compile_catalog(TRANSLATIONS, used_keys)
+
+
+def test_t__returns_text_of_current_locale(tested: Catalog):
+    tested.set_locale("en")
+    assert tested.t("new_game") == "New game"
+
+    tested.set_locale("fr")
+    assert tested.t("new_game") == "Nouvelle partie"
+    assert tested.locale == "fr"
+
+
+def test_t__with_key_id(tested: Catalog):
+    tested.set_locale("fr")
+
+    assert tested.t(tested.key_id("game_over")) == "Fin de partie"
+
+
+def test_load_translations__locales_define_same_keys():
+    translations = load_translations()
+
+    assert compile_catalog(translations)["keys"]
+
+
+@pytest.mark.parametrize("stale,expected", [(False, "Old game"), (True, "New game")])
+def test_get_catalog__when_locale_files_are_newer__compiles_them(
+    catalog_file, stale, expected
+):
+    mtime = max(f.stat().st_mtime for f in I18N_DIR.glob("*.json"))
+    mtime += -10 if stale else 10
+    os.utime(catalog_file, (mtime, mtime))
+
+    tested = get_catalog()
+
+    tested.set_locale("en")
+    assert tested.t("new_game") == expected